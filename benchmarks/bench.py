@@ -0,0 +1,284 @@
+"""Offline microbenchmarks for the scoring, astronomy and parsing hot paths.
+
+Everything runs against the fixtures in benchmarks/fixtures: a 7-day forecast
+in the Open-Meteo /v1/forecast response layout (2025-01-15..21, Sydney) and a
+de421 excerpt covering 2025-01-01..2025-03-01 (Sun, Earth, Moon, plus the
+Jupiter and Saturn barycenters Skyfield uses for light deflection). No network
+access or Home Assistant instance is needed.
+
+    python benchmarks/bench.py                      # full suite
+    python benchmarks/bench.py --quick              # skip the large scales
+    python benchmarks/bench.py --compare benchmarks/results/<rev>.json
+
+Results are written to benchmarks/results/<git revision>.json so runs from
+different commits can be compared.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(REPO_ROOT, "benchmarks", "fixtures")
+RESULTS_DIR = os.path.join(REPO_ROOT, "benchmarks", "results")
+sys.path.insert(0, REPO_ROOT)
+
+from custom_components.fishing_assistant_au import profile_table, score  # noqa: E402
+from custom_components.fishing_assistant_au.fish_profiles import FISH_PROFILES  # noqa: E402
+from custom_components.fishing_assistant_au.helpers import astro, moon  # noqa: E402
+
+WEATHER_FIXTURE = os.path.join(FIXTURE_DIR, "open_meteo_forecast.json")
+EPHEMERIS_FIXTURE = os.path.join(FIXTURE_DIR, "de421_2025q1.bsp")
+FIXTURE_START = datetime.date(2025, 1, 15)
+FIXTURE_LAT, FIXTURE_LON = -33.875, 151.25
+FIXTURE_TIMEZONE = "Australia/Sydney"
+# UTC days of astronomy behind the 7 local days, as get_location_forecast_data asks for
+ASTRONOMY_START = FIXTURE_START - datetime.timedelta(days=1)
+ASTRONOMY_DAYS = 9
+
+# (locations, species); None means every profile in FISH_PROFILES
+SCALES = [(1, 1), (10, None), (100, None), (500, None)]
+QUICK_SCALES = [(1, 1), (10, None)]
+
+
+def _time(func, repeat: int = 5, number: int = 1) -> dict:
+    """Run func `number` times per sample; report per-call milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1000)
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def _locations(n: int) -> list[tuple[float, float]]:
+    """Deterministic spots on a 0.05 degree grid around the fixture location."""
+    side = max(1, int(n ** 0.5 + 0.999))
+    return [
+        (round(FIXTURE_LAT + (i // side) * 0.05, 4), round(FIXTURE_LON + (i % side) * 0.05, 4))
+        for i in range(n)
+    ]
+
+
+def _astronomy_context() -> astro.AstronomyContext:
+    from skyfield.api import load, load_file
+
+    return astro.AstronomyContext(load.timescale(), load_file(EPHEMERIS_FIXTURE))
+
+
+def bench_parsing(results: dict, text: str) -> None:
+    results["parse/json_decode"] = _time(lambda: json.loads(text), number=200)
+    data = json.loads(text)
+    results["parse/build_hourly_arrays"] = _time(lambda: score.build_hourly_arrays(data), number=200)
+
+
+def bench_components(results: dict, hourly: dict, astro_data: astro.LocalAstronomy) -> None:
+    """Scalar reference scorers, timed over the full 168-hour horizon."""
+    profile = FISH_PROFILES["carp"]
+    weights = profile_table.get_profile_weights("lake")
+    days = [str(d) for d in hourly["datetime"].astype("datetime64[D]")]
+    rows = [
+        {key: hourly[key][i].item() for key in ("hour", "temp", "cloud", "pressure_trend", "wind", "precip")}
+        for i in range(len(days))
+    ]
+    day_astro = [astro_data.day(d) for d in days]
+
+    def score_hours():
+        for row, day in zip(rows, day_astro):
+            score._score_hour(row=row, profile=profile, astro=day, weights=weights)
+
+    results["score/_score_hour[168h]"] = _time(score_hours, number=20)
+
+    sunrise = [a["sunrise"] for a in day_astro]
+    sunset = [a["sunset"] for a in day_astro]
+    transit = [a["moon_transit"] for a in day_astro]
+    underfoot = [a["moon_underfoot"] for a in day_astro]
+    moonrise = [a["moonrise"] for a in day_astro]
+    moonset = [a["moonset"] for a in day_astro]
+
+    components = {
+        "temp": lambda: [score._score_temp(r["temp"], profile["temp_range"]) for r in rows],
+        "pressure_trend": lambda: [score._score_pressure_trend(r["pressure_trend"]) for r in rows],
+        "wind": lambda: [score._score_wind(r["wind"]) for r in rows],
+        "precip": lambda: [score._score_precip(r["precip"]) for r in rows],
+        "twilight": lambda: [
+            score._score_twilight(r["hour"], sr, ss) for r, sr, ss in zip(rows, sunrise, sunset)
+        ],
+        "moon_phase": lambda: [score._score_moon_phase(a.get("moon_phase")) for a in day_astro],
+        "solunar": lambda: [
+            score._score_solunar(r["hour"], t, u, mr, ms)
+            for r, t, u, mr, ms in zip(rows, transit, underfoot, moonrise, moonset)
+        ],
+    }
+    for name, func in components.items():
+        results[f"score/component/{name}[168h]"] = _time(func, number=50)
+
+
+def _score_profiles(hourly: dict, astro_data: astro.LocalAstronomy, profiles: list[dict], body_type: str):
+    table = profile_table.ProfileTable({str(i): profile for i, profile in enumerate(profiles)})
+    return score.score_table(hourly, astro_data, table, np.arange(len(table)), table.weights(body_type))
+
+
+def bench_vectorized(results: dict, hourly: dict, astro_data: astro.LocalAstronomy) -> None:
+    profiles = list(FISH_PROFILES.values())
+    # Compiling a table per call, as ad-hoc profile lists would need
+    results[f"score/ProfileTable+score_table[{len(profiles)} species]"] = _time(
+        lambda: _score_profiles(hourly, astro_data, profiles, "lake"), number=50
+    )
+    table = profile_table.BUILTIN_PROFILE_TABLE
+    rows = table.rows(list(table.names))
+    results[f"score/score_table[{len(profiles)} species]"] = _time(
+        lambda: score.score_table(hourly, astro_data, table, rows, table.weights("lake")), number=50
+    )
+
+    matrix = score.score_table(hourly, astro_data, table, rows, table.weights("lake"))
+    days, day_index = score._day_index(hourly)
+    for top_k in (1, 3):
+        results[f"window/best_windows[{len(profiles)} species, top {top_k}]"] = _time(
+            lambda: score.best_windows(matrix, day_index, len(days), 3, top_k), number=50
+        )
+
+
+def bench_astronomy(results: dict, context: astro.AstronomyContext) -> None:
+    # calculate_astronomy_forecast runs exactly this in the compute executor
+    results["astronomy/compute_astronomy_forecast[7d]"] = _time(
+        lambda: astro.compute_astronomy_forecast(context, FIXTURE_LAT, FIXTURE_LON, 7, FIXTURE_START),
+        repeat=3,
+    )
+    results["astronomy/compute_moon_days[7d]"] = _time(
+        lambda: moon.compute_moon_days(context, FIXTURE_START, 7), repeat=3
+    )
+    utc_astro = _utc_astronomy(context, FIXTURE_LAT, FIXTURE_LON, _moon_days(context))
+    results["astronomy/localize_astronomy[7d]"] = _time(
+        lambda: astro.localize_astronomy(utc_astro, FIXTURE_TIMEZONE, FIXTURE_START, 7), number=200
+    )
+
+
+def _moon_days(context: astro.AstronomyContext) -> dict:
+    return moon.compute_moon_days(context, ASTRONOMY_START, ASTRONOMY_DAYS)
+
+
+def _utc_astronomy(context: astro.AstronomyContext, lat: float, lon: float, moon_days: dict) -> dict:
+    events = astro.compute_astronomy_forecast(context, lat, lon, ASTRONOMY_DAYS, ASTRONOMY_START)
+    return {d: {**day, **moon_days[d]} for d, day in events.items()}
+
+
+def _local_astronomy(
+    context: astro.AstronomyContext, lat: float, lon: float, moon_days: dict
+) -> astro.LocalAstronomy:
+    return astro.localize_astronomy(
+        _utc_astronomy(context, lat, lon, moon_days), FIXTURE_TIMEZONE, FIXTURE_START, 7
+    )
+
+
+def bench_end_to_end(results: dict, text: str, context: astro.AstronomyContext, scales: list) -> None:
+    """The stages a refresh runs, per location, with cold caches."""
+    for n_locations, n_species in scales:
+        species = list(FISH_PROFILES)[:n_species] if n_species else list(FISH_PROFILES)
+        locations = _locations(n_locations)
+
+        def run():
+            # The moon tier is computed once for all locations, as in the integration
+            moon_days = _moon_days(context)
+            for lat, lon in locations:
+                weather = json.loads(text)
+                astro_data = _local_astronomy(context, lat, lon, moon_days)
+                score.build_location_forecast(weather, astro_data, "lake", species)
+
+        repeat = 3 if n_locations <= 10 else 1
+        results[f"end_to_end/{n_locations}x{len(species)}"] = _time(run, repeat=repeat)
+
+
+def _revision() -> str:
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        return f"{rev}-dirty" if dirty else rev
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _compare(current: dict, baseline_path: str, threshold: float) -> bool:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nComparison against {baseline.get('revision', baseline_path)} (median ms):")
+    regressed = False
+    for name, stats in current["results"].items():
+        old = baseline["results"].get(name)
+        if not old:
+            print(f"  {name:50s} {'':>10s} {stats['median_ms']:10.3f}  (new)")
+            continue
+        ratio = stats["median_ms"] / old["median_ms"] if old["median_ms"] else float("inf")
+        flag = "  REGRESSION" if ratio > threshold else ""
+        regressed |= bool(flag)
+        print(f"  {name:50s} {old['median_ms']:10.3f} {stats['median_ms']:10.3f}  x{ratio:5.2f}{flag}")
+    return regressed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Fishing Assistant hot-path benchmarks")
+    parser.add_argument("--quick", action="store_true", help="only run the small end-to-end scales")
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<revision>.json)")
+    parser.add_argument("--compare", help="baseline result file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.2, help="ratio reported as a regression")
+    args = parser.parse_args()
+
+    with open(WEATHER_FIXTURE, encoding="utf-8") as f:
+        text = f.read()
+    context = _astronomy_context()
+    hourly = score.build_hourly_arrays(json.loads(text))
+    astro_data = _local_astronomy(context, FIXTURE_LAT, FIXTURE_LON, _moon_days(context))
+
+    results: dict = {}
+    bench_parsing(results, text)
+    bench_components(results, hourly, astro_data)
+    bench_vectorized(results, hourly, astro_data)
+    bench_astronomy(results, context)
+    bench_end_to_end(results, text, context, QUICK_SCALES if args.quick else SCALES)
+    context.close()
+
+    import numpy
+
+    report = {
+        "revision": _revision(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": numpy.__version__,
+        "results": results,
+    }
+    for name, stats in results.items():
+        print(f"{name:50s} median {stats['median_ms']:10.3f} ms  min {stats['min_ms']:10.3f} ms")
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{report['revision']}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {output}")
+
+    if args.compare and _compare(report, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
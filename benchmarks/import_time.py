@@ -0,0 +1,73 @@
+"""Import-time regression check for the integration.
+
+Imports the package and its platform modules in a fresh interpreter, reports
+the wall time and the slowest modules from ``-X importtime``, and fails if the
+import pulls in deferred heavy dependencies or exceeds ``--max-ms``.
+
+    python benchmarks/import_time.py --max-ms 1500
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "custom_components.fishing_assistant_au"
+MODULES = [PACKAGE, f"{PACKAGE}.sensor", f"{PACKAGE}.config_flow"]
+DEFERRED = ["pandas", "skyfield"]
+
+# HA itself is imported first so only the integration's own cost is measured
+PROBE = f"""
+import json, sys, time
+import homeassistant.core, homeassistant.helpers.update_coordinator, homeassistant.components.sensor
+start = time.perf_counter()
+for name in {MODULES!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {DEFERRED!r} if m in sys.modules]}}))
+"""
+
+
+def _slowest(importtime_log: str, top: int) -> list[tuple[int, str]]:
+    rows = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if "fishing_assistant_au" in name or any(name.strip().startswith(d) for d in DEFERRED):
+            rows.append((int(cumulative), name))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-ms", type=float, default=None, help="fail if the import takes longer")
+    parser.add_argument("--top", type=int, default=10, help="number of slow modules to list")
+    args = parser.parse_args()
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+
+    print(f"import {PACKAGE} (+ sensor, config_flow): {probe['ms']:.1f} ms")
+    for cumulative, name in _slowest(result.stderr, args.top):
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failed = False
+    if probe["loaded"]:
+        print(f"FAIL: deferred modules imported eagerly: {', '.join(probe['loaded'])}")
+        failed = True
+    if args.max_ms is not None and probe["ms"] > args.max_ms:
+        print(f"FAIL: import took {probe['ms']:.1f} ms, limit {args.max_ms:.1f} ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""Estimate recorder rows and bytes written per day by the fish score sensors.
+
+Replays one simulated day of coordinator refreshes through FishScoreSensor,
+built from the benchmark fixtures, and counts what Home Assistant's state
+machine and recorder would store:
+
+- state rows: one per write whose state or attributes differ from the last
+- attribute rows: one per distinct recorded attribute set (the recorder
+  stores identical attribute sets once, keyed by hash)
+- attribute bytes: the JSON the recorder stores for those rows
+
+"before" records every attribute and writes on every refresh; "after" is
+the current sensor (forecast unrecorded, unchanged refreshes skipped). The
+restart step replaces the sensor with a fresh one, as Home Assistant does.
+
+    python benchmarks/recorder_writes.py
+"""
+import datetime
+import json
+import os
+import sys
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+
+from custom_components.fishing_assistant_au import score  # noqa: E402
+from custom_components.fishing_assistant_au.fish_profiles import FISH_PROFILES  # noqa: E402
+from custom_components.fishing_assistant_au.helpers import astro, moon  # noqa: E402
+from custom_components.fishing_assistant_au.sensor import FishScoreSensor  # noqa: E402
+
+FIXTURE_DIR = os.path.join(REPO_ROOT, "benchmarks", "fixtures")
+FIXTURE_START = datetime.date(2025, 1, 15)
+FIXTURE_LAT, FIXTURE_LON = -33.875, 151.25
+
+# One day as (step, UTC hour): a refresh per upstream model run, plus a
+# restart that loads the cached forecast, an outage that serves it as stale,
+# the revalidation that fetches the same forecast again, and a fetch before
+# the next model run is published that returns the forecast already shown
+DAY = [
+    ("model_run", 1),
+    ("model_run", 7),
+    ("restart", 9),
+    ("model_run", 13),
+    ("outage", 15),
+    ("revalidate", 16),
+    ("model_run", 19),
+    ("unpublished", 22),
+]
+
+
+class _Coordinator:
+    """Just enough of the coordinator for the sensor's update path."""
+
+    def __init__(self):
+        self.data = None
+        self.last_update_success = True
+
+    def async_update_listeners(self):
+        pass
+
+
+def _forecasts(weather: dict, astro_data: astro.LocalAstronomy, run: int) -> dict:
+    """Location forecast for model run `run`: the fixture with per-run temperature noise."""
+    weather = json.loads(json.dumps(weather))
+    noise = np.random.default_rng(run).normal(0, 1.0, len(weather["hourly"]["temperature_2m"]))
+    weather["hourly"]["temperature_2m"] = list(np.round(np.array(weather["hourly"]["temperature_2m"]) + noise, 1))
+    data = score.build_location_forecast(weather, astro_data, "lake", list(FISH_PROFILES))
+    # Relabel the fixture days so the sensors see "today" in their forecast
+    shift = datetime.date.today() - FIXTURE_START
+    data["forecasts"] = {
+        fish: {str(datetime.date.fromisoformat(d) + shift): day for d, day in forecast.items()}
+        for fish, forecast in data["forecasts"].items()
+    }
+    return data
+
+
+def _replay(make_sensor, steps: list[tuple[str, dict]], lean: bool) -> dict:
+    written = {"writes": 0, "state_rows": 0, "attribute_rows": 0, "attribute_bytes": 0}
+    last = None
+    # The recorder looks attribute sets up by hash, so this survives restarts
+    seen_attrs = set()
+
+    def write():
+        nonlocal last
+        written["writes"] += 1
+        attrs = dict(sensor.extra_state_attributes)
+        current = (sensor.native_value, json_bytes(attrs))
+        # The state machine drops writes that change nothing
+        if current == last:
+            return
+        last = current
+        written["state_rows"] += 1
+        recorded = json_bytes({
+            k: v for k, v in attrs.items() if not (lean and k in sensor._unrecorded_attributes)
+        })
+        if recorded not in seen_attrs:
+            seen_attrs.add(recorded)
+            written["attribute_rows"] += 1
+            written["attribute_bytes"] += len(recorded)
+
+    sensor = None
+    for kind, data in steps:
+        if sensor is None or kind == "restart":
+            # A new entity in an empty state machine, as async_added_to_hass leaves it
+            coordinator = _Coordinator()
+            coordinator.data = data
+            sensor = make_sensor(coordinator)
+            sensor.async_write_ha_state = write
+            last = None
+            sensor._update_from_coordinator()
+            sensor._written = sensor._write_key()
+            write()
+            continue
+        coordinator.data = data
+        if lean:
+            sensor._handle_coordinator_update()
+        else:
+            sensor._update_from_coordinator()
+            write()
+    return written
+
+
+def main() -> int:
+    from skyfield.api import load, load_file
+
+    with open(os.path.join(FIXTURE_DIR, "open_meteo_forecast.json"), encoding="utf-8") as f:
+        weather = json.load(f)
+    context = astro.AstronomyContext(load.timescale(), load_file(os.path.join(FIXTURE_DIR, "de421_2025q1.bsp")))
+    # The UTC days either side cover the local (Sydney) days
+    utc_start = FIXTURE_START - datetime.timedelta(days=1)
+    events = astro.compute_astronomy_forecast(context, FIXTURE_LAT, FIXTURE_LON, 9, utc_start)
+    moon_days = moon.compute_moon_days(context, utc_start, 9)
+    context.close()
+    astro_data = astro.localize_astronomy(
+        {d: {**day, **moon_days[d]} for d, day in events.items()}, "Australia/Sydney", FIXTURE_START, 7
+    )
+
+    # The coordinator adds fetched_at and stale to every payload
+    runs, steps = {}, []
+    fetched_at = None
+    for kind, hour in DAY:
+        if kind == "model_run":
+            runs[len(runs)] = _forecasts(weather, astro_data, len(runs))
+        if kind in ("model_run", "revalidate", "unpublished"):
+            fetched_at = datetime.datetime.combine(FIXTURE_START, datetime.time(hour), datetime.timezone.utc)
+        data = {**runs[len(runs) - 1], "fetched_at": fetched_at, "stale": kind == "outage"}
+        steps.append((kind, data))
+
+    totals = {}
+    for label, lean in (("before", False), ("after", True)):
+        totals[label] = {"writes": 0, "state_rows": 0, "attribute_rows": 0, "attribute_bytes": 0}
+        for fish in FISH_PROFILES:
+
+            def make_sensor(coordinator, fish=fish):
+                return FishScoreSensor(
+                    coordinator, "Bench", fish, FIXTURE_LAT, FIXTURE_LON, "lake", "Australia/Sydney", 20, "bench"
+                )
+
+            for key, value in _replay(make_sensor, steps, lean).items():
+                totals[label][key] += value
+
+    print(f"{len(FISH_PROFILES)} sensors, {len(DAY)} refreshes per day ({', '.join(kind for kind, _ in DAY)})")
+    print(f"  {'':18s} {'before':>10s} {'after':>10s}")
+    for key in ("writes", "state_rows", "attribute_rows", "attribute_bytes"):
+        print(f"  {key:18s} {totals['before'][key]:10d} {totals['after'][key]:10d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
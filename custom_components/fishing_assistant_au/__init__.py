@@ -2,7 +2,14 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers import config_validation as cv
 from homeassistant.core import HomeAssistant
-from .const import DOMAIN
+from .const import CONF_INSTRUMENTATION, DOMAIN
+from .coordinator import FishingAssistantCoordinator
+from .executor import shutdown_compute_executor
+from .helpers.astro import async_release_astronomy_user, register_astronomy_user
+from .helpers.astro_pool import shutdown_astronomy_pool
+from .instrumentation import STATS
+from .profile_table import DATA_PROFILE_TABLE
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS = ["sensor"]
@@ -10,18 +17,39 @@ PLATFORMS = ["sensor"]
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
-    """Set up Fishing Assistant from YAML (not used)."""
+    """Set up Fishing Assistant services; YAML configuration is not used."""
+    async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Fishing Assistant from a config entry."""
     _LOGGER.debug("Setting up entry: %s", entry.entry_id)
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    register_astronomy_user(entry.entry_id)
+    if entry.options.get(CONF_INSTRUMENTATION):
+        STATS.enable(entry.entry_id)
 
+    coordinator = FishingAssistantCoordinator(hass, entry)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        STATS.disable(entry.entry_id)
+        await async_release_astronomy_user(hass, entry.entry_id)
+        raise
+    hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.async_on_unload(coordinator.async_schedule_refreshes())
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    # The shared pools are sized from every entry's options; resize them on next use
+    shutdown_compute_executor(hass)
+    shutdown_astronomy_pool(hass)
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading entry: %s", entry.entry_id)
@@ -29,5 +57,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        STATS.disable(entry.entry_id)
+        await async_release_astronomy_user(hass, entry.entry_id)
+        if not hass.data[DOMAIN]:
+            shutdown_compute_executor(hass)
+            shutdown_astronomy_pool(hass)
+            # Re-read user profiles the next time an entry loads
+            hass.data.pop(DATA_PROFILE_TABLE, None)
 
     return unload_ok
@@ -1,6 +1,277 @@
-def get_forecast_data():
-    # Later
-    return {}
+import asyncio
+import datetime
+import logging
+import time
+
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
+from .instrumentation import STATS
+from .ratelimit import (
+    DATA_SCHEDULER,
+    DEFAULT_RETRY_AFTER,
+    PRIORITY_PREFETCH,
+    PRIORITY_REFRESH,
+    RequestScheduler,
+    async_get_request_scheduler,
+)
+
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
+HOURLY_VARIABLES = "temperature_2m,cloudcover,pressure_msl,precipitation,windspeed_10m"
+
+# Requests arriving within BATCH_WINDOW seconds share one multi-location call
+BATCH_WINDOW = 0.5
+BATCH_MAX_LOCATIONS = 50
+# Entries whose next refresh is this close are folded into a batch and served from it
+PREFETCH_HORIZON = datetime.timedelta(minutes=15)
+PREFETCH_TTL = PREFETCH_HORIZON.total_seconds() + 300
+
+DATA_BATCHER = f"{DOMAIN}_open_meteo_batcher"
+
+_LOGGER = logging.getLogger(__name__)
+
+# Requests currently on the wire, so identical concurrent callers share one response
+_in_flight: dict[tuple, asyncio.Task] = {}
+
+
+def forecast_dates(days: int = 7) -> tuple[datetime.date, datetime.date]:
+    """Return the (start, end) dates of the forecast horizon requested upstream."""
+    today = datetime.date.today()
+    return today, today + datetime.timedelta(days=days - 1)
+
+
+async def get_forecast_data(
+    hass: HomeAssistant,
+    lat: float,
+    lon: float,
+    timezone: str,
+    elevation: float,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    priority: int = PRIORITY_REFRESH,
+) -> dict:
+    """Fetch the hourly Open-Meteo forecast for one location, or {} on failure.
+
+    `priority` (see ratelimit) decides the order in which calls get upstream
+    budget when it is short.
+    """
+    key = (lat, lon, timezone, elevation, str(start_date), str(end_date))
+    request = _in_flight.get(key)
+    if request is None:
+        request = hass.async_create_task(
+            _get_batcher(hass).async_fetch(lat, lon, timezone, elevation, start_date, end_date, priority)
+        )
+        _in_flight[key] = request
+
+        def _forget(done: asyncio.Task) -> None:
+            if _in_flight.get(key) is done:
+                del _in_flight[key]
+
+        request.add_done_callback(_forget)
+    else:
+        STATS.count("open_meteo.in_flight_joined")
+        _LOGGER.debug("Joining in-flight Open-Meteo request for %s, %s", lat, lon)
+
+    return await asyncio.shield(request)
+
+
+def _get_batcher(hass: HomeAssistant) -> "OpenMeteoBatcher":
+    batcher = hass.data.get(DATA_BATCHER)
+    if batcher is None:
+        batcher = hass.data[DATA_BATCHER] = OpenMeteoBatcher(hass)
+    return batcher
+
+
+class OpenMeteoBatcher:
+    """Collect single-location requests into comma-separated multi-location calls.
+
+    Requests are grouped by (timezone, start, end) so each call has one set of
+    shared parameters. When a group flushes, any loaded entry whose own refresh
+    is due within PREFETCH_HORIZON rides along while the daily budget allows;
+    its result is parked and handed over when that entry asks for it. Each
+    call waits for the request scheduler at its most urgent request's priority.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._pending: dict[tuple, list[tuple]] = {}
+        self._flush_handles: dict[tuple, asyncio.TimerHandle] = {}
+        self._prefetched: dict[tuple, tuple[float, dict]] = {}
+
+    async def async_fetch(
+        self,
+        lat: float,
+        lon: float,
+        timezone: str,
+        elevation: float,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        priority: int = PRIORITY_REFRESH,
+    ) -> dict:
+        key = (lat, lon, timezone, elevation, str(start_date), str(end_date))
+        prefetched = self._prefetched.pop(key, None)
+        if prefetched and prefetched[0] > time.monotonic():
+            STATS.count("open_meteo.prefetch_hit")
+            _LOGGER.debug("Serving %s, %s from batched prefetch", lat, lon)
+            return prefetched[1]
+
+        group = (timezone, str(start_date), str(end_date))
+        future = self.hass.loop.create_future()
+        pending = self._pending.setdefault(group, [])
+        pending.append((lat, lon, elevation, future, priority))
+
+        if len(pending) >= BATCH_MAX_LOCATIONS:
+            self._flush(group)
+        elif group not in self._flush_handles:
+            self._flush_handles[group] = self.hass.loop.call_later(BATCH_WINDOW, self._flush, group)
+
+        return await future
+
+    @callback
+    def _flush(self, group: tuple) -> None:
+        handle = self._flush_handles.pop(group, None)
+        if handle is not None:
+            handle.cancel()
+        pending = self._pending.pop(group, [])
+        now = time.monotonic()
+        self._prefetched = {k: v for k, v in self._prefetched.items() if v[0] > now}
+        pending.extend(self._due_locations(group, pending))
+
+        for i in range(0, len(pending), BATCH_MAX_LOCATIONS):
+            self.hass.async_create_task(
+                self._async_fetch_chunk(group, pending[i:i + BATCH_MAX_LOCATIONS])
+            )
+
+    def _due_locations(self, group: tuple, pending: list[tuple]) -> list[tuple]:
+        """Locations of other loaded entries that will refresh shortly."""
+        wanted = {(lat, lon, elevation) for lat, lon, elevation, *_ in pending}
+        extra = []
+        for coordinator in self.hass.data.get(DOMAIN, {}).values():
+            upcoming = getattr(coordinator, "upcoming_forecast_request", None)
+            request = upcoming(PREFETCH_HORIZON) if upcoming else None
+            if not request:
+                continue
+            lat, lon, timezone, elevation, start, end = request
+            if (timezone, start, end) != group or (lat, lon, elevation) in wanted:
+                continue
+            if request in _in_flight or request in self._prefetched:
+                continue
+            wanted.add((lat, lon, elevation))
+            extra.append((lat, lon, elevation, None, PRIORITY_PREFETCH))
+
+        # Prefetching is the first thing to go when the daily budget runs low
+        scheduler = self.hass.data.get(DATA_SCHEDULER)
+        if extra and isinstance(scheduler, RequestScheduler):
+            if not scheduler.allows(len(pending) + len(extra), PRIORITY_PREFETCH):
+                _LOGGER.debug("Skipping prefetch of %d location(s) to save upstream budget", len(extra))
+                return []
+        return extra
+
+    async def _async_fetch_chunk(self, group: tuple, chunk: list[tuple]) -> None:
+        timezone, start_date, end_date = group
+        results = [{} for _ in chunk]
+        try:
+            scheduler = await async_get_request_scheduler(self.hass)
+            priority = min(priority for *_, priority in chunk)
+            if await scheduler.async_acquire(len(chunk), priority):
+                results = await _fetch_forecast_data(
+                    self.hass,
+                    [lat for lat, *_ in chunk],
+                    [lon for _, lon, *_ in chunk],
+                    [elevation for _, _, elevation, *_ in chunk],
+                    timezone,
+                    start_date,
+                    end_date,
+                )
+        except Exception:
+            _LOGGER.exception("Open-Meteo call for %d location(s) failed", len(chunk))
+        finally:
+            # Every waiter gets an answer, even if this task failed or was cancelled
+            expires = time.monotonic() + PREFETCH_TTL
+            for (lat, lon, elevation, future, _), data in zip(chunk, results):
+                if future is None:
+                    if data:
+                        self._prefetched[(lat, lon, timezone, elevation, start_date, end_date)] = (expires, data)
+                elif not future.done():
+                    future.set_result(data)
+
+
+async def _fetch_forecast_data(
+    hass: HomeAssistant,
+    lats: list[float],
+    lons: list[float],
+    elevations: list[float],
+    timezone: str,
+    start_date: str,
+    end_date: str,
+) -> list[dict]:
+    """Fetch several locations in one call; returns one dict per location ({} on failure)."""
+    params = {
+        "latitude": ",".join(str(lat) for lat in lats),
+        "longitude": ",".join(str(lon) for lon in lons),
+        "hourly": HOURLY_VARIABLES,
+        "daily": "sunrise,sunset",
+        "timezone": timezone,
+        "elevation": ",".join(str(elevation) for elevation in elevations),
+        "start_date": str(start_date),
+        "end_date": str(end_date)
+    }
+    _LOGGER.debug("Making Open-Meteo API request for %d location(s): %s", len(lats), params)
+    STATS.count("open_meteo.requests")
+    STATS.count("open_meteo.locations", len(lats))
+    failed = [{} for _ in lats]
+
+    # HA's shared session keeps connections alive across refreshes
+    session = async_get_clientsession(hass)
+    try:
+        with STATS.timer("fetch"):
+            async with session.get(
+                OPEN_METEO_URL,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
+                if response.status == 429:
+                    scheduler = await async_get_request_scheduler(hass)
+                    scheduler.pause(_retry_after(response.headers.get("Retry-After")))
+                    return failed
+                if response.status != 200:
+                    error_text = await response.text()
+                    _LOGGER.error("Open-Meteo API error: Status %s, Response: %s", response.status, error_text)
+                    return failed
+                body = await response.read()
+
+        with STATS.timer("json_decode"):
+            data = json_loads(body)
+        _LOGGER.debug("Open-Meteo response: %s", data)
+    except Exception as e:
+        _LOGGER.error("Exception while fetching Open-Meteo data: %s", e)
+        return failed
+
+    # A single location comes back as an object, several as a list in request order
+    results = data if isinstance(data, list) else [data]
+    if len(results) != len(lats):
+        _LOGGER.warning("Open-Meteo returned %d forecasts for %d locations", len(results), len(lats))
+        return failed
+
+    forecasts = []
+    for lat, lon, result in zip(lats, lons, results):
+        if "hourly" not in result or "daily" not in result:
+            _LOGGER.warning("Open-Meteo fetch failed for %s, %s: %s", lat, lon, result)
+            result = {}
+        forecasts.append(result)
+    return forecasts
+
+
+def _retry_after(value: str | None) -> float:
+    """Seconds from a Retry-After header (delta-seconds form only)."""
+    try:
+        return max(1.0, float(value))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
 
 def get_moon_data():
         return {}
@@ -0,0 +1,253 @@
+"""Offline backtest: score archived hourly weather through the live scoring core.
+
+An archive directory holds one sub-directory per location, each containing
+chunk files in time order (file names sort chronologically). A chunk has the
+Open-Meteo archive hourly columns (time, temperature_2m, cloudcover,
+pressure_msl, precipitation, windspeed_10m), either as arrays in an .npz file
+or as a .parquet table (Parquet needs pandas and pyarrow). Chunks must start
+at local midnight so no day is split between two files. locations.json in
+the archive root lists the locations, with the IANA timezone of the chunk
+times (UTC if omitted):
+
+    [{"id": "ammersee", "lat": 48.0, "lon": 11.1, "body_type": "lake", "timezone": "Europe/Berlin"}]
+
+Run it with:
+
+    python -m custom_components.fishing_assistant_au.backtest <archive> --out <dir>
+
+Astronomy for each location's whole period is computed in one almanac pass,
+with the locations spread over helpers/astro_pool's worker processes, and
+converted to local time once. Chunks are then scored in a process pool, and
+each worker holds at most one chunk plus the neighbouring rows it needs. For each location, the daily
+score and best window start of every species are written to <out>/<id>.npz.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+import argparse
+import json
+import logging
+import os
+
+import numpy as np
+
+from .const import DEFAULT_WINDOW_HOURS
+from .helpers.astro import LocalAstronomy, _load_astronomy_context, ephemeris_path, localize_astronomy
+from .helpers.astro_pool import arrays_to_forecast, compute_astronomy_bulk
+from .helpers.moon import compute_moon_days
+from .profile_table import (
+    BUILTIN_PROFILE_TABLE,
+    COMPONENTS,
+    ProfileTable,
+    build_profile_table,
+    load_user_profiles,
+)
+from .score import _day_index, _sample_minutes, best_windows, build_hourly_arrays, score_table
+
+_LOGGER = logging.getLogger(__name__)
+
+HOURLY_COLUMNS = ("temperature_2m", "cloudcover", "pressure_msl", "precipitation", "windspeed_10m")
+CHUNK_SUFFIXES = (".npz", ".parquet")
+
+
+def list_chunks(directory: str) -> list[str]:
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(CHUNK_SUFFIXES)
+    )
+
+
+def read_chunk(path: str, columns: tuple[str, ...] = ("time", *HOURLY_COLUMNS)) -> dict[str, np.ndarray]:
+    """Load the requested columns of one chunk; time becomes datetime64[m]."""
+    if path.endswith(".parquet"):
+        import pandas as pd
+
+        frame = pd.read_parquet(path, columns=list(columns))
+        data = {name: frame[name].to_numpy() for name in columns}
+    else:
+        with np.load(path, allow_pickle=False) as archive:
+            data = {name: archive[name] for name in columns}
+    if "time" in data:
+        data["time"] = np.asarray(data["time"]).astype("datetime64[m]")
+    return data
+
+
+def _score_chunk(
+    path: str,
+    previous: str | None,
+    following: str | None,
+    astro_data: LocalAstronomy,
+    table: ProfileTable,
+    species: list[str],
+    weights: list[float],
+    window_hours: int,
+) -> dict[str, np.ndarray]:
+    """Daily scores and best-window starts for the days in one chunk."""
+    chunk = read_chunk(path)
+    n_rows = len(chunk["time"])
+    step = _sample_minutes({"datetime": chunk["time"]})
+    length = max(1, round(window_hours * 60 / step))
+
+    # Windows starting late on the chunk's last day run into the next chunk
+    if following:
+        head = read_chunk(following)
+        chunk = {name: np.concatenate((values, head[name][:length - 1])) for name, values in chunk.items()}
+
+    hourly = build_hourly_arrays({"hourly": chunk})
+    if previous:
+        before = read_chunk(previous, ("pressure_msl",))["pressure_msl"][-1]
+        hourly["pressure_trend"][0] = hourly["pressure"][0] - before
+
+    scores = score_table(hourly, astro_data, table, table.rows(species), np.asarray(weights))
+    days, day_index = _day_index(hourly)
+    n_days = int(day_index[n_rows - 1]) + 1
+    daily, _ = best_windows(scores, day_index, len(days), length, 1)
+    starts = daily[:, :n_days, 0]
+
+    # Same arithmetic as the live path: a sequential sum over the window, then scale_score
+    found = starts >= 0
+    safe = np.where(found, starts, 0)
+    total = np.zeros(starts.shape)
+    for offset in range(length):
+        total = total + np.take_along_axis(scores, safe + offset, axis=1)
+    average = np.where(found, total / length, 0.0)
+    scaled = np.clip(np.round((average - 0.5) / (0.9 - 0.5) * 10), 0, 10).astype(np.int8)
+
+    return {
+        "dates": np.array(days[:n_days], dtype="datetime64[D]"),
+        "scores": scaled,
+        "best_start": np.where(found, hourly["datetime"][safe], np.datetime64("NaT", "m")),
+    }
+
+
+def run_backtest(
+    archive: str,
+    out_dir: str | None = None,
+    species: list[str] | None = None,
+    window_hours: int = DEFAULT_WINDOW_HOURS,
+    workers: int | None = None,
+    ephemeris: str | None = None,
+    weights: dict | None = None,
+    table: ProfileTable = BUILTIN_PROFILE_TABLE,
+) -> dict[str, dict[str, np.ndarray]]:
+    """Backtest every location in `archive`; `weights` overrides the body-type weights.
+
+    `table` holds the profiles to score, e.g. build_profile_table() with the
+    user's profiles; the built-in species by default. The astronomy workers
+    are spawned, so a script calling this needs an `if __name__ == "__main__":`
+    guard.
+    """
+    species = list(species or table.names)
+    unknown = [fish for fish in species if fish not in table]
+    if unknown:
+        raise ValueError(f"No fish profile found for {', '.join(unknown)}")
+
+    with open(os.path.join(archive, "locations.json"), encoding="utf-8") as f:
+        locations = json.load(f)
+
+    # Download once here rather than racing in every worker
+    ephemeris = ephemeris or ephemeris_path()
+
+    plans = []
+    for location in locations:
+        chunks = list_chunks(os.path.join(archive, location["id"]))
+        if not chunks:
+            _LOGGER.warning("No chunks for location %s", location["id"])
+            continue
+        first = read_chunk(chunks[0], ("time",))["time"][0].astype("datetime64[D]")
+        last = read_chunk(chunks[-1], ("time",))["time"][-1].astype("datetime64[D]")
+        # One extra day covers windows running past the final midnight
+        days = int((last - first) // np.timedelta64(1, "D")) + 2
+        plans.append((location, chunks, first.item(), days))
+
+    # A UTC day either side covers the local days at both ends
+    utc_spans = [(first - timedelta(days=1), days + 2) for _, _, first, days in plans]
+    events = compute_astronomy_bulk(
+        [(location["lat"], location["lon"], *span) for (location, *_), span in zip(plans, utc_spans)],
+        workers,
+        ephemeris,
+    )
+    # The moon phase does not depend on the location: one vectorized pass each, here
+    context = _load_astronomy_context(ephemeris)
+    try:
+        moon = [compute_moon_days(context, start, days) for start, days in utc_spans]
+    finally:
+        context.close()
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        scheduled = []
+        for (location, chunks, first, days), arrays, moon_days in zip(plans, events, moon):
+            utc_astro = {d: {**day, **moon_days[d]} for d, day in arrays_to_forecast(arrays).items()}
+            astro_data = localize_astronomy(utc_astro, location.get("timezone", "UTC"), first, days)
+            body_weights = (
+                [weights[name] for name in COMPONENTS] if weights
+                else table.weights(location.get("body_type", "lake")).tolist()
+            )
+            futures = []
+            for i, path in enumerate(chunks):
+                span = read_chunk(path, ("time",))["time"].astype("datetime64[D]")
+                offset = int((span[0] - np.datetime64(first)) // np.timedelta64(1, "D"))
+                # The chunk's days plus the next one
+                n_days = int((span[-1] - span[0]) // np.timedelta64(1, "D")) + 2
+                futures.append(pool.submit(
+                    _score_chunk,
+                    path,
+                    chunks[i - 1] if i else None,
+                    chunks[i + 1] if i + 1 < len(chunks) else None,
+                    LocalAstronomy(
+                        span[0].item(),
+                        {key: minutes[offset:offset + n_days] for key, minutes in astro_data.events.items()},
+                        astro_data.moon_phase[offset:offset + n_days],
+                    ),
+                    table,
+                    species,
+                    body_weights,
+                    window_hours,
+                ))
+            scheduled.append((location, futures))
+
+        for location, futures in scheduled:
+            parts = [future.result() for future in futures]
+            result = {
+                "species": np.array(species),
+                "dates": np.concatenate([p["dates"] for p in parts]),
+                "scores": np.concatenate([p["scores"] for p in parts], axis=1),
+                "best_start": np.concatenate([p["best_start"] for p in parts], axis=1),
+            }
+            results[location["id"]] = result
+            if out_dir:
+                os.makedirs(out_dir, exist_ok=True)
+                np.savez_compressed(os.path.join(out_dir, f"{location['id']}.npz"), **result)
+            _LOGGER.info("Backtested %s: %d days x %d species", location["id"], len(result["dates"]), len(species))
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backtest fishing scores over archived weather")
+    parser.add_argument("archive", help="directory with locations.json and one chunk folder per location")
+    parser.add_argument("--out", help="write <id>.npz results here")
+    parser.add_argument("--species", nargs="*", help="profiles to score (default: all)")
+    parser.add_argument("--window-hours", type=int, default=DEFAULT_WINDOW_HOURS)
+    parser.add_argument("--workers", type=int, help="process pool size (default: CPU count)")
+    parser.add_argument("--ephemeris", help="local .bsp file (default: the integration's de421)")
+    parser.add_argument("--weights", help="JSON object of component weights to use instead of body-type weights")
+    parser.add_argument(
+        "--config-dir", help="Home Assistant config directory whose fishing_assistant_profiles file adds species"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    run_backtest(
+        args.archive,
+        args.out,
+        args.species,
+        args.window_hours,
+        args.workers,
+        args.ephemeris,
+        json.loads(args.weights) if args.weights else None,
+        build_profile_table(load_user_profiles(args.config_dir)) if args.config_dir else BUILTIN_PROFILE_TABLE,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,30 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 
-from .const import DOMAIN
-from .helpers.location import resolve_location_metadata_sync
-from .fish_profiles import get_fish_species
+from .const import (
+    CONF_ASTRONOMY_CELL_DEG,
+    CONF_ASTRONOMY_PROCESSES,
+    CONF_COMPUTE_WORKERS,
+    CONF_INSTRUMENTATION,
+    CONF_TOP_K,
+    CONF_WEATHER_CELL_DEG,
+    CONF_WINDOW_HOURS,
+    DEFAULT_ASTRONOMY_CELL_DEG,
+    DEFAULT_ASTRONOMY_PROCESSES,
+    DEFAULT_COMPUTE_WORKERS,
+    DEFAULT_TOP_K,
+    DEFAULT_WEATHER_CELL_DEG,
+    DEFAULT_WINDOW_HOURS,
+    DOMAIN,
+    MAX_ASTRONOMY_CELL_DEG,
+    MAX_ASTRONOMY_PROCESSES,
+    MAX_COMPUTE_WORKERS,
+    MAX_TOP_K,
+    MAX_WEATHER_CELL_DEG,
+    MAX_WINDOW_HOURS,
+)
+from .helpers.location import async_resolve_location_metadata
+from .profile_table import BODY_TYPES, async_get_profile_table
 
 class FishingAssistantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle Fishing Assistant config flow."""
@@ -27,9 +48,7 @@ class FishingAssistantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(f"{lat:.5f}_{lon:.5f}")
             self._abort_if_unique_id_configured()
 
-            metadata = await self.hass.async_add_executor_job(
-                resolve_location_metadata_sync, lat, lon
-            )
+            metadata = await async_resolve_location_metadata(self.hass, lat, lon)
 
             return self.async_create_entry(
                 title=name,
@@ -44,6 +63,7 @@ class FishingAssistantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
+        table = await async_get_profile_table(self.hass)
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema({
@@ -54,13 +74,13 @@ class FishingAssistantConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     selector.SelectSelectorConfig(
                         options=[
                             {"value": f, "label": f.replace("_", " ").title()}
-                            for f in sorted(get_fish_species())
+                            for f in sorted(table.names)
                         ],
                         multiple=True,
                         mode=selector.SelectSelectorMode.DROPDOWN
                     )
                 ),
-                vol.Required("body_type"): vol.In(["lake", "river", "pond", "reservoir"]),
+                vol.Required("body_type"): vol.In(list(BODY_TYPES)),
             }),
             errors=errors
         )
@@ -88,6 +108,7 @@ class FishingAssistantOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        table = await async_get_profile_table(self.hass)
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
@@ -95,13 +116,41 @@ class FishingAssistantOptionsFlow(config_entries.OptionsFlow):
                     selector.SelectSelectorConfig(
                         options=[
                             {"value": f, "label": f.replace("_", " ").title()}
-                            for f in sorted(get_fish_species())
+                            for f in sorted(table.names)
                         ],
                         multiple=True,
                         mode=selector.SelectSelectorMode.DROPDOWN
                     )
                 ),
                 vol.Required("body_type", default=self.config_entry.data.get("body_type", "lake")):
-                    vol.In(["lake", "river", "pond", "reservoir"]),
+                    vol.In(list(BODY_TYPES)),
+                vol.Optional(
+                    CONF_WINDOW_HOURS,
+                    default=self.config_entry.options.get(CONF_WINDOW_HOURS, DEFAULT_WINDOW_HOURS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_WINDOW_HOURS)),
+                vol.Optional(
+                    CONF_TOP_K,
+                    default=self.config_entry.options.get(CONF_TOP_K, DEFAULT_TOP_K),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_TOP_K)),
+                vol.Optional(
+                    CONF_WEATHER_CELL_DEG,
+                    default=self.config_entry.options.get(CONF_WEATHER_CELL_DEG, DEFAULT_WEATHER_CELL_DEG),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_WEATHER_CELL_DEG)),
+                vol.Optional(
+                    CONF_ASTRONOMY_CELL_DEG,
+                    default=self.config_entry.options.get(CONF_ASTRONOMY_CELL_DEG, DEFAULT_ASTRONOMY_CELL_DEG),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=MAX_ASTRONOMY_CELL_DEG)),
+                vol.Optional(
+                    CONF_COMPUTE_WORKERS,
+                    default=self.config_entry.options.get(CONF_COMPUTE_WORKERS, DEFAULT_COMPUTE_WORKERS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_COMPUTE_WORKERS)),
+                vol.Optional(
+                    CONF_ASTRONOMY_PROCESSES,
+                    default=self.config_entry.options.get(CONF_ASTRONOMY_PROCESSES, DEFAULT_ASTRONOMY_PROCESSES),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=MAX_ASTRONOMY_PROCESSES)),
+                vol.Optional(
+                    CONF_INSTRUMENTATION,
+                    default=self.config_entry.options.get(CONF_INSTRUMENTATION, False),
+                ): bool,
             })
         )
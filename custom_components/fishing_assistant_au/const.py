@@ -1,2 +1,60 @@
-DOMAIN = "fishing_assistant"
+from datetime import timedelta
+
+# Must match the domain in manifest.json
+DOMAIN = "fishing_assistant_au"
 DEFAULT_NAME = "Fishing Assistant"
+
+SERVICE_GET_FORECAST = "get_forecast"
+MAX_SERVICE_LOCATIONS = 50
+
+CONF_COMPUTE_WORKERS = "compute_workers"
+DEFAULT_COMPUTE_WORKERS = 2
+MAX_COMPUTE_WORKERS = 8
+# Worker processes for astronomy (0 = compute in the thread pool)
+CONF_ASTRONOMY_PROCESSES = "astronomy_processes"
+DEFAULT_ASTRONOMY_PROCESSES = 0
+MAX_ASTRONOMY_PROCESSES = 8
+
+# Best-window search: window length in hours and windows reported per day/horizon
+CONF_WINDOW_HOURS = "window_hours"
+DEFAULT_WINDOW_HOURS = 3
+MAX_WINDOW_HOURS = 12
+CONF_TOP_K = "top_k"
+DEFAULT_TOP_K = 3
+MAX_TOP_K = 10
+
+# Grid cells (degrees) that nearby entries snap to, sharing one weather fetch and
+# one astronomy computation per cell (0 = use the exact location)
+CONF_WEATHER_CELL_DEG = "weather_cell_deg"
+DEFAULT_WEATHER_CELL_DEG = 0.05
+MAX_WEATHER_CELL_DEG = 0.25
+CONF_ASTRONOMY_CELL_DEG = "astronomy_cell_deg"
+DEFAULT_ASTRONOMY_CELL_DEG = 0.01
+MAX_ASTRONOMY_CELL_DEG = 0.25
+# Elevations within a weather cell are rounded to this many metres
+WEATHER_CELL_ELEVATION_STEP = 50
+
+# Optional offline elevation tiles (SRTM .hgt or .npy), relative to the HA config dir
+DEM_DIRECTORY = "fishing_assistant_dem"
+
+# Collect per-stage timings for diagnostics (off by default)
+CONF_INSTRUMENTATION = "instrumentation"
+
+# Astronomy cache: events are cached per (lat/lon cell, UTC date)
+ASTRO_CACHE_STORAGE_KEY = f"{DOMAIN}.astronomy"
+ASTRO_CACHE_STORAGE_VERSION = 2
+ASTRO_CACHE_MAX_CELLS = 256
+# Local days start up to a day either side of the UTC date, so keep two past days
+ASTRO_CACHE_KEEP_PAST_DAYS = 2
+
+# Weather cache: forecasts stay valid until the next upstream model run is published
+WEATHER_CACHE_STORAGE_KEY = f"{DOMAIN}.weather"
+WEATHER_CACHE_STORAGE_VERSION = 1
+# Locations kept, least recently used dropped first (service calls add ad-hoc ones)
+WEATHER_CACHE_MAX_ENTRIES = 256
+MODEL_RUN_HOURS_UTC = (0, 6, 12, 18)
+MODEL_RUN_AVAILABILITY_DELAY = timedelta(hours=5)
+
+# Open-Meteo calls used today, persisted so restarts keep counting
+REQUEST_BUDGET_STORAGE_KEY = f"{DOMAIN}.request_budget"
+REQUEST_BUDGET_STORAGE_VERSION = 1
@@ -0,0 +1,247 @@
+import asyncio
+import datetime
+import hashlib
+import logging
+import random
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_time_change,
+    async_track_utc_time_change,
+)
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import forecast_dates
+from .const import (
+    CONF_ASTRONOMY_CELL_DEG,
+    CONF_TOP_K,
+    CONF_WEATHER_CELL_DEG,
+    CONF_WINDOW_HOURS,
+    DEFAULT_ASTRONOMY_CELL_DEG,
+    DEFAULT_TOP_K,
+    DEFAULT_WEATHER_CELL_DEG,
+    DEFAULT_WINDOW_HOURS,
+    DOMAIN,
+    MODEL_RUN_AVAILABILITY_DELAY,
+    MODEL_RUN_HOURS_UTC,
+)
+from .executor import RefreshTimer, async_run_compute
+from .helpers.grid import weather_cell
+from .helpers.weather_cache import DATA_WEATHER_CACHE, WeatherCache
+from .profile_table import async_get_profile_table
+from .ratelimit import PRIORITY_REFRESH, PRIORITY_URGENT
+from .score import build_location_forecast, get_location_forecast_data
+
+_LOGGER = logging.getLogger(__name__)
+
+# Refresh when each upstream model run is published (UTC hours)
+REFRESH_HOURS_UTC = sorted(
+    (hour + int(MODEL_RUN_AVAILABILITY_DELAY.total_seconds() // 3600)) % 24 for hour in MODEL_RUN_HOURS_UTC
+)
+# Entries spread their refreshes over this window after each refresh hour
+REFRESH_JITTER = datetime.timedelta(minutes=10)
+# Forecast builds (the CPU stage of a refresh) running at once across all
+# entries; the upstream wait is not capped, so the batcher can merge every
+# entry refreshing at the same time into one call
+MAX_CONCURRENT_BUILDS = 4
+DATA_BUILD_SEMAPHORE = f"{DOMAIN}_build_semaphore"
+# Revalidation of a stale forecast: first retry after STALE_REFRESH_DELAY seconds,
+# doubling per failed attempt up to STALE_REFRESH_MAX_DELAY
+STALE_REFRESH_DELAY = 10
+STALE_REFRESH_MAX_DELAY = 1800
+
+
+def refresh_offset(entry_id: str) -> datetime.timedelta:
+    """Deterministic per-entry delay within REFRESH_JITTER, stable across restarts."""
+    digest = hashlib.sha256(entry_id.encode()).digest()
+    return datetime.timedelta(seconds=int.from_bytes(digest[:4], "big") % int(REFRESH_JITTER.total_seconds()))
+
+
+def next_refresh_time(after: datetime.datetime, offset: datetime.timedelta) -> datetime.datetime:
+    """First scheduled refresh strictly after `after` (UTC) for an entry with `offset`."""
+    day = after.astimezone(datetime.timezone.utc).date()
+    for days in range(2):
+        for hour in REFRESH_HOURS_UTC:
+            at = datetime.datetime(
+                day.year, day.month, day.day, hour, tzinfo=datetime.timezone.utc
+            ) + datetime.timedelta(days=days) + offset
+            if at > after:
+                return at
+    return after + datetime.timedelta(hours=6)
+
+
+def revalidate_delay(attempt: int) -> float:
+    """Seconds before revalidation attempt `attempt` (from 0), jittered over the upper half."""
+    delay = min(STALE_REFRESH_MAX_DELAY, STALE_REFRESH_DELAY * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+def _build_semaphore(hass: HomeAssistant) -> asyncio.Semaphore:
+    semaphore = hass.data.get(DATA_BUILD_SEMAPHORE)
+    if semaphore is None:
+        semaphore = hass.data[DATA_BUILD_SEMAPHORE] = asyncio.Semaphore(MAX_CONCURRENT_BUILDS)
+    return semaphore
+
+
+class FishingAssistantCoordinator(DataUpdateCoordinator):
+    """Fetch weather and astronomy once per location for all species sensors.
+
+    There is no polling interval: refreshes fire at REFRESH_HOURS_UTC plus a
+    per-entry offset, so entries do not all hit Open-Meteo in the same second.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{entry.entry_id}",
+            update_interval=None,
+        )
+        self.lat = entry.data["latitude"]
+        self.lon = entry.data["longitude"]
+        self.timezone = entry.data["timezone"]
+        self.elevation = entry.data["elevation"]
+        self.fish = entry.data["fish"]
+        self.body_type = entry.data["body_type"]
+        self.window_hours = entry.options.get(CONF_WINDOW_HOURS, DEFAULT_WINDOW_HOURS)
+        self.top_k = entry.options.get(CONF_TOP_K, DEFAULT_TOP_K)
+        self.weather_cell_deg = entry.options.get(CONF_WEATHER_CELL_DEG, DEFAULT_WEATHER_CELL_DEG)
+        self.astronomy_cell_deg = entry.options.get(CONF_ASTRONOMY_CELL_DEG, DEFAULT_ASTRONOMY_CELL_DEG)
+        self._last_refresh: datetime.datetime | None = None
+        self.last_refresh_duration: float | None = None
+        self._unsub_stale_refresh = None
+        self.revalidate_attempt = 0
+        self.refresh_offset = refresh_offset(entry.entry_id)
+        self._unsub_schedule: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_schedule_refreshes(self) -> CALLBACK_TYPE:
+        """Refresh at every REFRESH_HOURS_UTC + this entry's offset; returns the unsubscribe."""
+        offset = int(self.refresh_offset.total_seconds())
+
+        async def _refresh(_now) -> None:
+            await self.async_refresh()
+
+        @callback
+        def _new_day(_now) -> None:
+            # Sensors pick the new day's score out of the forecast they already have
+            if self.data is not None:
+                self.async_update_listeners()
+
+        self._unsub_schedule = [
+            async_track_utc_time_change(
+                self.hass, _refresh, hour=REFRESH_HOURS_UTC, minute=offset // 60, second=offset % 60
+            ),
+            async_track_time_change(self.hass, _new_day, hour=0, minute=0, second=offset % 60),
+        ]
+        return self._cancel_schedule
+
+    @callback
+    def _cancel_schedule(self) -> None:
+        while self._unsub_schedule:
+            self._unsub_schedule.pop()()
+
+    def upcoming_forecast_request(self, horizon: datetime.timedelta) -> tuple | None:
+        """Return this entry's Open-Meteo request key if its next refresh is within `horizon`."""
+        if self._last_refresh is None or not self._unsub_schedule:
+            return None
+        now = dt_util.utcnow()
+        next_refresh = next_refresh_time(now, self.refresh_offset)
+        if next_refresh - now > horizon:
+            return None
+
+        start_date, end_date = forecast_dates()
+        cell = weather_cell(self.lat, self.lon, self.elevation, self.weather_cell_deg)
+        weather_cache = self.hass.data.get(DATA_WEATHER_CACHE)
+        if isinstance(weather_cache, WeatherCache):
+            cached = weather_cache.get(cell.lat, cell.lon, self.timezone, cell.elevation, start_date, end_date)
+            if cached and cached.valid_until > next_refresh:
+                return None
+        return (cell.lat, cell.lon, self.timezone, cell.elevation, str(start_date), str(end_date))
+
+    async def _async_update_data(self) -> dict:
+        self._last_refresh = dt_util.utcnow()
+        timer = RefreshTimer(self.name)
+        try:
+            with timer:
+                return await self._async_build_forecast()
+        finally:
+            self.last_refresh_duration = timer.wall
+
+    async def _async_build_forecast(self) -> dict:
+        # On first load render straight from the (possibly expired) disk cache
+        first_load = self.data is None
+        # Entries showing nothing or a stale forecast go upstream first
+        urgent = first_load or self.data.get("stale")
+        data = await get_location_forecast_data(
+            self.hass,
+            lat=self.lat,
+            lon=self.lon,
+            timezone=self.timezone,
+            elevation=self.elevation,
+            allow_stale=first_load,
+            weather_cell_deg=self.weather_cell_deg,
+            astronomy_cell_deg=self.astronomy_cell_deg,
+            priority=PRIORITY_URGENT if urgent else PRIORITY_REFRESH,
+        )
+        if not data:
+            if first_load:
+                raise UpdateFailed(f"No forecast data for {self.lat}, {self.lon}")
+            # Nothing stored for this cell either: keep the forecast already shown
+            _LOGGER.warning("No forecast data for %s, %s; keeping the last forecast", self.lat, self.lon)
+            self._schedule_revalidation()
+            return {**self.data, "stale": True}
+
+        if data["stale"]:
+            self._schedule_revalidation()
+        else:
+            self._cancel_revalidation()
+            self.revalidate_attempt = 0
+
+        table = await async_get_profile_table(self.hass)
+        async with _build_semaphore(self.hass):
+            forecast = await async_run_compute(
+                self.hass,
+                build_location_forecast,
+                data["weather"],
+                data["astro"],
+                self.body_type,
+                self.fish,
+                self.window_hours,
+                self.top_k,
+                table,
+            )
+        forecast["stale"] = data["stale"]
+        forecast["fetched_at"] = data["fetched_at"]
+        return forecast
+
+    def _schedule_revalidation(self) -> None:
+        """Retry upstream in the background with capped exponential backoff."""
+        if self._unsub_stale_refresh is not None:
+            return
+
+        delay = revalidate_delay(self.revalidate_attempt)
+        self.revalidate_attempt += 1
+        _LOGGER.debug(
+            "Forecast for %s is stale, revalidating in %.0f s (attempt %d)",
+            self.name, delay, self.revalidate_attempt,
+        )
+
+        async def _refresh(_now) -> None:
+            self._unsub_stale_refresh = None
+            await self.async_refresh()
+
+        self._unsub_stale_refresh = async_call_later(self.hass, delay, _refresh)
+
+    def _cancel_revalidation(self) -> None:
+        if self._unsub_stale_refresh is not None:
+            self._unsub_stale_refresh()
+            self._unsub_stale_refresh = None
+
+    async def async_shutdown(self) -> None:
+        self._cancel_schedule()
+        self._cancel_revalidation()
+        await super().async_shutdown()
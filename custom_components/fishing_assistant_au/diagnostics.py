@@ -0,0 +1,44 @@
+"""Diagnostics support for Fishing Assistant."""
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .instrumentation import STATS
+from .ratelimit import async_get_request_scheduler
+
+TO_REDACT = {"latitude", "longitude"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return entry settings, refresh state, upstream budget and the rolling performance counters."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    refresh = {}
+    if coordinator is not None:
+        refresh = {
+            "last_update_success": coordinator.last_update_success,
+            "last_refresh_ms": _ms(coordinator.last_refresh_duration),
+            "stale": bool(coordinator.data and coordinator.data.get("stale")),
+            "forecast_age_s": _age(coordinator.data),
+            "revalidate_attempt": coordinator.revalidate_attempt,
+        }
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "refresh": refresh,
+        "upstream": (await async_get_request_scheduler(hass)).snapshot(),
+        "performance": STATS.summary(),
+    }
+
+
+def _ms(seconds: float | None) -> float | None:
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def _age(data: dict | None) -> float | None:
+    fetched_at = data.get("fetched_at") if data else None
+    return None if fetched_at is None else round((dt_util.utcnow() - fetched_at).total_seconds())
@@ -0,0 +1,101 @@
+"""Bounded worker pool for the CPU-bound forecast pipeline."""
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+import time
+import logging
+
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_COMPUTE_WORKERS, DEFAULT_COMPUTE_WORKERS, DOMAIN
+from .instrumentation import STATS
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_COMPUTE_EXECUTOR = f"{DOMAIN}_compute_executor"
+
+# Seconds of worker time spent on behalf of the refresh running in this context
+_refresh_compute_time: ContextVar[list[float] | None] = ContextVar(
+    "fishing_assistant_refresh_compute_time", default=None
+)
+
+
+def _configured_workers(hass: HomeAssistant) -> int:
+    # One pool serves every entry; the largest setting wins
+    workers = [
+        entry.options.get(CONF_COMPUTE_WORKERS, DEFAULT_COMPUTE_WORKERS)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ]
+    return max(workers, default=DEFAULT_COMPUTE_WORKERS)
+
+
+def _get_executor(hass: HomeAssistant) -> ThreadPoolExecutor:
+    executor = hass.data.get(DATA_COMPUTE_EXECUTOR)
+    if executor is None:
+        max_workers = _configured_workers(hass)
+        _LOGGER.debug("Starting compute executor with %d worker(s)", max_workers)
+        executor = hass.data[DATA_COMPUTE_EXECUTOR] = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{DOMAIN}_compute"
+        )
+    return executor
+
+
+def _timed(func, args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+async def async_run_compute(hass: HomeAssistant, func, *args):
+    """Run CPU-bound work in the bounded compute pool; the event loop only awaits."""
+    result, elapsed = await hass.loop.run_in_executor(_get_executor(hass), _timed, func, args)
+
+    spent = _refresh_compute_time.get()
+    if spent is not None:
+        spent.append(elapsed)
+    return result
+
+
+class RefreshTimer:
+    """Measure how long a refresh ran compute in the pool and held the loop.
+
+    The compute total is what used to block the event loop before the
+    pipeline moved to the worker pool.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.wall: float | None = None
+
+    def __enter__(self):
+        self._spent: list[float] = []
+        self._token = _refresh_compute_time.set(self._spent)
+        self._start = time.perf_counter()
+        self._loop_start = time.thread_time()
+        return self
+
+    def __exit__(self, *exc):
+        # Upper bound: includes anything else the loop ran while this refresh awaited
+        loop_cpu = time.thread_time() - self._loop_start
+        wall = self.wall = time.perf_counter() - self._start
+        _refresh_compute_time.reset(self._token)
+        STATS.record("refresh", wall)
+        _LOGGER.debug(
+            "Refresh %s: %.1f ms compute in %d worker job(s) (previously blocking the event loop), "
+            "%.1f ms loop-thread CPU, %.1f ms wall",
+            self.name,
+            sum(self._spent) * 1000,
+            len(self._spent),
+            loop_cpu * 1000,
+            wall * 1000,
+        )
+        return False
+
+
+def shutdown_compute_executor(hass: HomeAssistant) -> None:
+    """Stop the pool; it restarts on next use, sized from the entries' current options.
+
+    Jobs already submitted still run to completion.
+    """
+    executor = hass.data.pop(DATA_COMPUTE_EXECUTOR, None)
+    if executor is not None:
+        executor.shutdown(wait=False)
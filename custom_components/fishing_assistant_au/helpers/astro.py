@@ -1,53 +1,161 @@
-from datetime import datetime, timedelta, timezone
-from typing import Dict
-from skyfield.api import load, wgs84
-from skyfield import almanac
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, NamedTuple
+import asyncio
 import os
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 import logging
 
+import numpy as np
 
-async def calculate_astronomy_forecast(hass: HomeAssistant, lat: float, lon: float, days: int = 7) -> Dict[str, dict]:
-    ts = load.timescale()
-    
+from ..executor import async_run_compute
+from ..instrumentation import STATS
+
+
+_LOGGER = logging.getLogger(__name__)
+
+EPHEMERIS_URL = "https://naif.jpl.nasa.gov/pub/naif/generic_kernels/spk/planets/de421.bsp"
+
+EVENT_KEYS = ("sunrise", "sunset", "moonrise", "moonset", "moon_transit", "moon_underfoot")
+# Minutes-since-midnight value for "no such event that day"
+NO_EVENT = -1
+
+
+class AstronomyContext:
+    """Timescale and ephemeris shared by every config entry in the process."""
+
+    def __init__(self, ts, eph):
+        self.ts = ts
+        self.eph = eph
+
+    def close(self) -> None:
+        self.eph.close()
+
+
+_context: AstronomyContext | None = None
+_context_loading: asyncio.Future | None = None
+_context_users: set[str] = set()
+
+
+def ephemeris_path() -> str:
+    """Path of the de421 ephemeris, downloading it on first use (blocking)."""
     # Check if ephemeris file exists, if not create the directory
     data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
     os.makedirs(data_dir, exist_ok=True)
-    
+
     eph_path = os.path.join(data_dir, "de421.bsp")
-    
+
     # Download if not exists
     if not os.path.exists(eph_path):
-        _LOGGER = logging.getLogger(__name__)
         _LOGGER.info("Downloading skyfield ephemeris data...")
-        # Use executor to download without blocking
-        def download_eph():
-            import urllib.request
-            url = "https://naif.jpl.nasa.gov/pub/naif/generic_kernels/spk/planets/de421.bsp"
-            urllib.request.urlretrieve(url, eph_path)
-            return load(eph_path)
-            
-        eph = await hass.async_add_executor_job(download_eph)
-    else:
-        # Load existing file
-        eph = await hass.async_add_executor_job(lambda: load(eph_path))
+        import urllib.request
+        urllib.request.urlretrieve(EPHEMERIS_URL, eph_path)
+    return eph_path
+
+
+def _load_astronomy_context(eph_path: str | None = None) -> AstronomyContext:
+    # Skyfield is heavy to import; keep it off the integration import path
+    from skyfield.api import load, load_file
+
+    eph_path = eph_path or ephemeris_path()
+
+    # load_file keeps the SPK kernel memory-mapped; segments are paged in on use
+    with STATS.timer("ephemeris_load"):
+        return AstronomyContext(load.timescale(), load_file(eph_path))
+
+
+async def async_get_astronomy_context(hass: HomeAssistant) -> AstronomyContext:
+    """Return the shared astronomy context, loading it once on first use."""
+    global _context, _context_loading
+
+    if _context is not None:
+        return _context
+
+    # Concurrent first callers all await the same load
+    if _context_loading is None:
+        _context_loading = hass.async_add_executor_job(_load_astronomy_context)
+
+    loading = _context_loading
+    try:
+        context = await asyncio.shield(loading)
+    except Exception:
+        if _context_loading is loading:
+            _context_loading = None
+        raise
+
+    if _context is None:
+        _context = context
+        _context_loading = None
+    return _context
+
+
+def register_astronomy_user(entry_id: str) -> None:
+    """Mark a config entry as using the shared astronomy context."""
+    _context_users.add(entry_id)
+
+
+async def async_release_astronomy_user(hass: HomeAssistant, entry_id: str) -> None:
+    """Drop a config entry; close the context once no entry uses it."""
+    global _context
+
+    _context_users.discard(entry_id)
+    if _context_users or _context is None:
+        return
+
+    context, _context = _context, None
+    await hass.async_add_executor_job(context.close)
+
+
+async def calculate_astronomy_forecast(
+    hass: HomeAssistant, lat: float, lon: float, days: int = 7, start_date: date | None = None
+) -> Dict[str, dict]:
+    context = await async_get_astronomy_context(hass)
+    return await async_run_compute(
+        hass, compute_astronomy_forecast, context, lat, lon, days, start_date
+    )
+
+
+def compute_astronomy_forecast(
+    context: AstronomyContext, lat: float, lon: float, days: int = 7, start_date: date | None = None
+) -> Dict[str, dict]:
+    """Run the almanac searches for one location (CPU-bound, blocking).
+
+    Returns {UTC date: {event: minutes since UTC midnight, or None}}.
+    """
+    with STATS.timer("astronomy"):
+        return _compute_astronomy_forecast(context, lat, lon, days, start_date)
+
+
+def _utc_minutes(t) -> tuple[str, int]:
+    """UTC date and minutes since UTC midnight, rounded to the second first."""
+    moment = t.utc_datetime() + timedelta(microseconds=500_000)
+    return str(moment.date()), moment.hour * 60 + moment.minute
+
+
+def _compute_astronomy_forecast(
+    context: AstronomyContext, lat: float, lon: float, days: int, start_date: date | None
+) -> Dict[str, dict]:
+    from skyfield import almanac
+    from skyfield.api import wgs84
+
+    ts = context.ts
+    eph = context.eph
     location = wgs84.latlon(lat, lon)
 
-    start_date = datetime.now(timezone.utc).date()
+    if start_date is None:
+        start_date = datetime.now(timezone.utc).date()
     end_date = start_date + timedelta(days=days)
 
     t0 = ts.utc(start_date.year, start_date.month, start_date.day)
     t1 = ts.utc(end_date.year, end_date.month, end_date.day)
 
-    # Astronomy events
-    moon_phases = almanac.moon_phases(eph)
+    # Per-location events; the moon phase is the same everywhere (helpers/moon.py)
     moon_rise_set = almanac.risings_and_settings(eph, eph['Moon'], location)
     moon_transits = almanac.meridian_transits(eph, eph['Moon'], location)
     sun_rise_set = almanac.sunrise_sunset(eph, location)
 
     # Init empty containers
     events = {
-        "moon_phase": {},
         "moonrise": {},
         "moonset": {},
         "moon_transit": {},
@@ -56,34 +164,26 @@ async def calculate_astronomy_forecast(hass: HomeAssistant, lat: float, lon: flo
         "sunset": {}
     }
 
-    # Moon phase per day
-    times, phases = almanac.find_discrete(t0, t1, moon_phases)
-    for t, p in zip(times, phases):
-        date_str = str(t.utc_datetime().date())
-        events["moon_phase"][date_str] = float(round(p % 1, 3))
-
     # Moonrise / moonset
     times, events_raw = almanac.find_discrete(t0, t1, moon_rise_set)
     for t, ev in zip(times, events_raw):
-        date_str = str(t.utc_datetime().date())
+        date_str, minutes = _utc_minutes(t)
         key = "moonrise" if ev == 1 else "moonset"
-        events[key][date_str] = t.utc_strftime("%H:%M")
+        events[key][date_str] = minutes
 
     # Transit / underfoot
     times, events_raw = almanac.find_discrete(t0, t1, moon_transits)
     for t, ev in zip(times, events_raw):
-        date_str = str(t.utc_datetime().date())
+        date_str, minutes = _utc_minutes(t)
         key = "moon_transit" if ev == 1 else "moon_underfoot"
-        if key not in events:
-            events[key] = {}
-        events[key][date_str] = t.utc_strftime("%H:%M")
+        events[key][date_str] = minutes
 
     # Sunrise / sunset
     times, events_raw = almanac.find_discrete(t0, t1, sun_rise_set)
     for t, ev in zip(times, events_raw):
-        date_str = str(t.utc_datetime().date())
+        date_str, minutes = _utc_minutes(t)
         key = "sunrise" if ev == 1 else "sunset"
-        events[key][date_str] = t.utc_strftime("%H:%M")
+        events[key][date_str] = minutes
 
     # Final forecast
     forecast = {}
@@ -91,7 +191,6 @@ async def calculate_astronomy_forecast(hass: HomeAssistant, lat: float, lon: flo
         d = start_date + timedelta(days=i)
         ds = str(d)
         forecast[ds] = {
-            "moon_phase": events["moon_phase"].get(ds),
             "moonrise": events["moonrise"].get(ds),
             "moonset": events["moonset"].get(ds),
             "moon_transit": events["moon_transit"].get(ds),
@@ -101,3 +200,70 @@ async def calculate_astronomy_forecast(hass: HomeAssistant, lat: float, lon: flo
         }
 
     return forecast
+
+
+class LocalAstronomy(NamedTuple):
+    """Sun and moon events for consecutive local days, in the form the scorers use.
+
+    `events` holds int16 minutes since local midnight per EVENT_KEYS name, one
+    entry per day from `start` (NO_EVENT when it does not happen that day), and
+    `moon_phase` one value per day (NaN when unknown).
+    """
+
+    start: date
+    events: Dict[str, np.ndarray]
+    moon_phase: np.ndarray
+
+    def for_days(self, days: list[str]) -> tuple[Dict[str, np.ndarray], np.ndarray]:
+        """Events and moon phase for the ISO dates `days`; days not covered have none."""
+        offsets = np.array([(date.fromisoformat(d) - self.start).days for d in days], dtype=int)
+        covered = (offsets >= 0) & (offsets < len(self.moon_phase))
+        rows = np.where(covered, offsets, 0)
+        if not len(self.moon_phase):
+            none = np.full(len(days), NO_EVENT, dtype=np.int16)
+            return {key: none for key in EVENT_KEYS}, np.full(len(days), np.nan)
+        events = {
+            key: np.where(covered, minutes[rows], NO_EVENT).astype(np.int16) for key, minutes in self.events.items()
+        }
+        return events, np.where(covered, self.moon_phase[rows], np.nan)
+
+    def day(self, day: str) -> dict:
+        """One day's events as minutes since local midnight (None if absent) and its moon phase."""
+        events, moon_phase = self.for_days([day])
+        result = {key: None if minutes[0] == NO_EVENT else int(minutes[0]) for key, minutes in events.items()}
+        result["moon_phase"] = None if np.isnan(moon_phase[0]) else float(moon_phase[0])
+        return result
+
+
+def localize_astronomy(
+    astro_data: Dict[str, dict], timezone_name: str, start: date, days: int
+) -> LocalAstronomy:
+    """Convert per-UTC-day events (minutes since UTC midnight) to `days` local days from `start`.
+
+    Each event lands on the local date it happens on; if an event happens twice
+    in one local day, the later one is kept. `astro_data` should cover the UTC
+    day before `start` and the one after the last day, so no event is missed.
+    """
+    tz = dt_util.get_time_zone(timezone_name) or dt_util.UTC
+    events = {key: np.full(days, NO_EVENT, dtype=np.int16) for key in EVENT_KEYS}
+    moon_phase = np.full(days, np.nan)
+
+    for day_str in sorted(astro_data):
+        day = astro_data[day_str]
+        utc_day = date.fromisoformat(day_str)
+        midnight = datetime(utc_day.year, utc_day.month, utc_day.day, tzinfo=timezone.utc)
+        for key in EVENT_KEYS:
+            minutes = day.get(key)
+            if minutes is None:
+                continue
+            local = (midnight + timedelta(minutes=minutes)).astimezone(tz)
+            i = (local.date() - start).days
+            if 0 <= i < days:
+                events[key][i] = local.hour * 60 + local.minute
+
+        # The phase barely moves within a day; take the value for the same date
+        i = (utc_day - start).days
+        if 0 <= i < days and day.get("moon_phase") is not None:
+            moon_phase[i] = day["moon_phase"]
+
+    return LocalAstronomy(start, events, moon_phase)
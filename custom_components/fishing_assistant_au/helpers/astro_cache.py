@@ -0,0 +1,139 @@
+"""Persistent per-location astronomy cache."""
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import (
+    ASTRO_CACHE_KEEP_PAST_DAYS,
+    ASTRO_CACHE_MAX_CELLS,
+    ASTRO_CACHE_STORAGE_KEY,
+    ASTRO_CACHE_STORAGE_VERSION,
+    DEFAULT_ASTRONOMY_CELL_DEG,
+    DOMAIN,
+)
+from ..instrumentation import STATS
+from .astro import calculate_astronomy_forecast
+from .astro_pool import get_astronomy_pool
+from .grid import quantize
+from .moon import async_get_moon_days
+from .shared import async_get_shared
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ASTRO_CACHE = f"{DOMAIN}_astro_cache"
+SAVE_DELAY = 30
+
+
+class _AstronomyStore(Store):
+    async def _async_migrate_func(self, old_major_version: int, old_minor_version: int, old_data: dict) -> dict:
+        if old_major_version < 2:
+            # Version 1 stored events as "HH:MM" (UTC) and a per-cell moon phase
+            for cell in old_data.get("cells", {}).values():
+                for day in cell["days"].values():
+                    day.pop("moon_phase", None)
+                    for key, value in day.items():
+                        if isinstance(value, str):
+                            hours, minutes = value.split(":")
+                            day[key] = int(hours) * 60 + int(minutes)
+        return old_data
+
+
+class AstronomyCache:
+    """Sun and moon events keyed by (quantized lat/lon, date), persisted in .storage.
+
+    Events for a given place and day never change, so a refresh only computes
+    the days that are not cached yet (normally the one that just entered the
+    horizon). Past days are dropped by age and whole cells by least recent use.
+    The moon phase is not stored per cell; it comes from the global moon table.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._store = _AstronomyStore(hass, ASTRO_CACHE_STORAGE_VERSION, ASTRO_CACHE_STORAGE_KEY)
+        self._cells: Dict[str, dict] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        if stored:
+            self._cells = stored.get("cells", {})
+        self._evict()
+
+    async def async_get_forecast(
+        self,
+        lat: float,
+        lon: float,
+        days: int = 7,
+        cell_deg: float = DEFAULT_ASTRONOMY_CELL_DEG,
+        start_date: date | None = None,
+    ) -> Dict[str, dict]:
+        """Return astronomy for `days` UTC days from `start_date` (default today), computing only missing ones.
+
+        Events are minutes since UTC midnight; see localize_astronomy.
+        """
+        cell_lat, cell_lon = quantize(lat, lon, cell_deg)
+        key = f"{cell_lat:.4f},{cell_lon:.4f}"
+        start_date = start_date or datetime.now(timezone.utc).date()
+        wanted = [str(start_date + timedelta(days=i)) for i in range(days)]
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            cell = self._cells.setdefault(key, {"days": {}})
+            missing = [d for d in wanted if d not in cell["days"]]
+            STATS.count("astro_cache.day_hit", len(wanted) - len(missing))
+            STATS.count("astro_cache.day_miss", len(missing))
+
+            if missing:
+                first = date.fromisoformat(missing[0])
+                span = (date.fromisoformat(missing[-1]) - first).days + 1
+                _LOGGER.debug("Computing astronomy for %s: %d day(s) from %s", key, span, first)
+                pool = get_astronomy_pool(self.hass)
+                if pool is not None:
+                    computed = await pool.async_compute(cell_lat, cell_lon, span, first)
+                else:
+                    computed = await calculate_astronomy_forecast(
+                        self.hass, cell_lat, cell_lon, days=span, start_date=first
+                    )
+                if not computed:
+                    return {}
+                cell["days"].update(computed)
+
+            cell["last_used"] = datetime.now(timezone.utc).isoformat()
+            moon = await async_get_moon_days(self.hass, start_date, days)
+            result = {d: {**cell["days"][d], **moon[d]} for d in wanted}
+
+        if missing:
+            self._evict()
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return result
+
+    def _evict(self) -> None:
+        oldest = str(datetime.now(timezone.utc).date() - timedelta(days=ASTRO_CACHE_KEEP_PAST_DAYS))
+        for cell in self._cells.values():
+            cell["days"] = {d: v for d, v in cell["days"].items() if d >= oldest}
+
+        if len(self._cells) > ASTRO_CACHE_MAX_CELLS:
+            by_use = sorted(self._cells, key=lambda k: self._cells[k].get("last_used", ""))
+            for key in by_use[:len(self._cells) - ASTRO_CACHE_MAX_CELLS]:
+                del self._cells[key]
+
+        # Locks of evicted cells go too, unless a computation still holds one
+        for key in [k for k, lock in self._locks.items() if k not in self._cells and not lock.locked()]:
+            del self._locks[key]
+
+    def _data_to_save(self) -> dict:
+        return {"cells": self._cells}
+
+
+async def async_get_astronomy_cache(hass: HomeAssistant) -> AstronomyCache:
+    """Return the process-wide astronomy cache, loading it from disk on first use."""
+    return await async_get_shared(hass, DATA_ASTRO_CACHE, _async_load_cache)
+
+
+async def _async_load_cache(hass: HomeAssistant) -> AstronomyCache:
+    cache = AstronomyCache(hass)
+    await cache.async_load()
+    return cache
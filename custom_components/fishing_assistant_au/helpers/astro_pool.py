@@ -0,0 +1,145 @@
+"""Process-pool astronomy for many locations at once.
+
+Skyfield's root finding holds the GIL, so threads serialize it. Each worker
+process loads the ephemeris once and returns compact per-day arrays instead
+of dicts.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from typing import Dict
+import multiprocessing
+import logging
+
+import numpy as np
+from homeassistant.core import HomeAssistant
+
+from ..const import CONF_ASTRONOMY_PROCESSES, DEFAULT_ASTRONOMY_PROCESSES, DOMAIN
+from ..instrumentation import STATS
+from .astro import (
+    EVENT_KEYS,
+    NO_EVENT,
+    AstronomyContext,
+    _load_astronomy_context,
+    compute_astronomy_forecast,
+    ephemeris_path,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ASTRONOMY_POOL = f"{DOMAIN}_astronomy_pool"
+
+# (lat, lon, start date, days)
+AstronomyRequest = tuple[float, float, date, int]
+
+# Set in each worker by _init_worker
+_worker_context: AstronomyContext | None = None
+
+
+def forecast_to_arrays(forecast: Dict[str, dict]) -> dict:
+    """Pack a per-day forecast into int16 minutes (UTC) per event."""
+    days = list(forecast)
+    arrays = {"start": days[0] if days else None, "days": len(days)}
+    for key in EVENT_KEYS:
+        arrays[key] = np.array(
+            [NO_EVENT if forecast[d].get(key) is None else forecast[d][key] for d in days], dtype=np.int16
+        )
+    return arrays
+
+
+def arrays_to_forecast(arrays: dict) -> Dict[str, dict]:
+    """Inverse of forecast_to_arrays, in the layout the astronomy cache stores."""
+    if not arrays["days"]:
+        return {}
+    start = date.fromisoformat(arrays["start"])
+    forecast = {}
+    for i in range(arrays["days"]):
+        day = {}
+        for key in EVENT_KEYS:
+            minutes = int(arrays[key][i])
+            day[key] = None if minutes == NO_EVENT else minutes
+        forecast[str(start + timedelta(days=i))] = day
+    return forecast
+
+
+def _init_worker(eph_path: str) -> None:
+    global _worker_context
+    _worker_context = _load_astronomy_context(eph_path)
+
+
+def _compute_arrays(lat: float, lon: float, start_date: date, days: int) -> dict:
+    return forecast_to_arrays(compute_astronomy_forecast(_worker_context, lat, lon, days, start_date))
+
+
+def _executor(workers: int | None, eph_path: str) -> ProcessPoolExecutor:
+    # spawn: forking a process with running threads (like HA) is unsafe
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(eph_path,),
+    )
+
+
+def compute_astronomy_bulk(
+    requests: list[AstronomyRequest], workers: int | None = None, eph_path: str | None = None
+) -> list[dict]:
+    """Compute many locations across a temporary process pool (blocking, for scripts)."""
+    with _executor(workers, eph_path or ephemeris_path()) as pool:
+        return list(pool.map(_compute_arrays, *zip(*requests))) if requests else []
+
+
+class AstronomyProcessPool:
+    """Long-lived worker processes that keep the ephemeris loaded between refreshes."""
+
+    def __init__(self, hass: HomeAssistant, workers: int):
+        self.hass = hass
+        self.workers = workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def _async_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            eph_path = await self.hass.async_add_executor_job(ephemeris_path)
+            if self._pool is None:
+                _LOGGER.debug("Starting astronomy process pool with %d worker(s)", self.workers)
+                self._pool = _executor(self.workers, eph_path)
+        return self._pool
+
+    async def async_compute(self, lat: float, lon: float, days: int, start_date: date) -> Dict[str, dict]:
+        """Compute one location in a worker; concurrent calls run in parallel."""
+        pool = await self._async_pool()
+        with STATS.timer("astronomy"):
+            arrays = await self.hass.loop.run_in_executor(pool, _compute_arrays, lat, lon, start_date, days)
+        return arrays_to_forecast(arrays)
+
+    def shutdown(self) -> None:
+        # Computations already submitted still finish
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+
+def _configured_processes(hass: HomeAssistant) -> int:
+    # One pool serves every entry; the largest setting wins
+    processes = [
+        entry.options.get(CONF_ASTRONOMY_PROCESSES, DEFAULT_ASTRONOMY_PROCESSES)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ]
+    return max(processes, default=DEFAULT_ASTRONOMY_PROCESSES)
+
+
+def get_astronomy_pool(hass: HomeAssistant) -> AstronomyProcessPool | None:
+    """The shared process pool, or None when no entry enabled astronomy processes."""
+    pool = hass.data.get(DATA_ASTRONOMY_POOL)
+    if pool is None:
+        processes = _configured_processes(hass)
+        if not processes:
+            return None
+        pool = hass.data[DATA_ASTRONOMY_POOL] = AstronomyProcessPool(hass, processes)
+    return pool
+
+
+def shutdown_astronomy_pool(hass: HomeAssistant) -> None:
+    """Stop the worker processes; a new pool is sized from the current options on next use."""
+    pool = hass.data.pop(DATA_ASTRONOMY_POOL, None)
+    if pool is not None:
+        pool.shutdown()
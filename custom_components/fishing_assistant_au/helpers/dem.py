@@ -0,0 +1,96 @@
+"""Offline elevation from SRTM-style height tiles, read through memory maps."""
+from collections import OrderedDict
+import logging
+import math
+import os
+import threading
+
+import numpy as np
+
+_LOGGER = logging.getLogger(__name__)
+
+# Open tiles kept mapped; pages are only read as lookups touch them
+MAX_OPEN_TILES = 32
+# SRTM marks missing samples with this value
+VOID = -32768
+
+
+def tile_name(lat: float, lon: float) -> str:
+    """SRTM tile name for the 1x1 degree tile holding a point, e.g. S34E151."""
+    south = math.floor(lat)
+    west = math.floor(lon)
+    return f"{'N' if south >= 0 else 'S'}{abs(south):02d}{'E' if west >= 0 else 'W'}{abs(west):03d}"
+
+
+class DemElevationProvider:
+    """Bilinear elevation lookups over a directory of 1x1 degree tiles.
+
+    Tiles are named like S34E151 and are either SRTM/Copernicus .hgt files
+    (big-endian int16, 1201 or 3601 samples square, north row first, edges
+    shared with the neighbouring tiles) or .npy arrays in the same layout.
+    Each tile is memory-mapped on first use, so only the pages around looked-up
+    points are read from disk.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._tiles: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def elevation_at(self, lat: float, lon: float) -> float | None:
+        """Elevation in metres, or None when no tile covers the point (blocking)."""
+        tile = self._tile(tile_name(lat, lon))
+        if tile is None:
+            return None
+
+        size = tile.shape[0] - 1
+        # Fractional sample position; row 0 is the tile's north edge
+        row = (math.floor(lat) + 1 - lat) * size
+        col = (lon - math.floor(lon)) * size
+        r0 = min(int(row), size - 1)
+        c0 = min(int(col), size - 1)
+        dr = row - r0
+        dc = col - c0
+
+        corners = np.asarray(tile[r0:r0 + 2, c0:c0 + 2], dtype=np.float64)
+        weights = np.array([[(1 - dr) * (1 - dc), (1 - dr) * dc], [dr * (1 - dc), dr * dc]])
+        valid = corners != VOID
+        if not valid.any():
+            return None
+        # Voids drop out and the remaining corners are re-weighted
+        weights = np.where(valid, weights, 0.0)
+        total = weights.sum()
+        if total == 0:
+            return float(corners[valid].mean())
+        return float((corners * weights).sum() / total)
+
+    def _tile(self, name: str) -> np.ndarray | None:
+        with self._lock:
+            if name in self._tiles:
+                self._tiles.move_to_end(name)
+                return self._tiles[name]
+
+            tile = self._open(name)
+            # Missing tiles are not remembered, so tiles added later are picked up
+            if tile is not None:
+                self._tiles[name] = tile
+                while len(self._tiles) > MAX_OPEN_TILES:
+                    self._tiles.popitem(last=False)
+            return tile
+
+    def _open(self, name: str) -> np.ndarray | None:
+        hgt = os.path.join(self.directory, f"{name}.hgt")
+        npy = os.path.join(self.directory, f"{name}.npy")
+        try:
+            if os.path.exists(hgt):
+                samples = os.path.getsize(hgt) // 2
+                side = math.isqrt(samples)
+                if side * side != samples:
+                    _LOGGER.warning("Ignoring %s: %d samples is not a square tile", hgt, samples)
+                    return None
+                return np.memmap(hgt, dtype=">i2", mode="r", shape=(side, side))
+            if os.path.exists(npy):
+                return np.load(npy, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            _LOGGER.warning("Could not open elevation tile %s: %s", name, e)
+        return None
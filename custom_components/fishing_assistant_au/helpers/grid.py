@@ -0,0 +1,37 @@
+"""Snap locations onto shared grid cells so nearby entries share upstream work."""
+from typing import NamedTuple
+
+from ..const import WEATHER_CELL_ELEVATION_STEP
+
+
+class WeatherCell(NamedTuple):
+    """The point a weather forecast is requested for; entries in one cell share it."""
+
+    lat: float
+    lon: float
+    elevation: float
+
+
+def quantize(lat: float, lon: float, step: float) -> tuple[float, float]:
+    """Snap a coordinate to the centre of its cell (a step of 0 leaves it unchanged)."""
+    if step <= 0:
+        return lat, lon
+    return (
+        round(round(lat / step) * step, 6),
+        round(round(lon / step) * step, 6),
+    )
+
+
+def weather_cell(lat: float, lon: float, elevation: float, step: float) -> WeatherCell:
+    """Weather request point for a location.
+
+    Open-Meteo downscales temperature by the given elevation, so within a
+    cell the elevation is rounded to WEATHER_CELL_ELEVATION_STEP metres
+    rather than dropped.
+    """
+    if step <= 0:
+        return WeatherCell(lat, lon, elevation)
+    cell_lat, cell_lon = quantize(lat, lon, step)
+    return WeatherCell(
+        cell_lat, cell_lon, round(elevation / WEATHER_CELL_ELEVATION_STEP) * WEATHER_CELL_ELEVATION_STEP
+    )
@@ -1,23 +1,143 @@
-import httpx
-from timezonefinder import TimezoneFinder
+"""Timezone and elevation lookup for new locations."""
+from collections import OrderedDict
+from functools import lru_cache
+import asyncio
+import logging
+import threading
+
+import aiohttp
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from ..const import DEM_DIRECTORY, DOMAIN
+from .dem import DemElevationProvider
+
+_LOGGER = logging.getLogger(__name__)
+
+ELEVATION_URL = "https://api.open-elevation.com/api/v1/lookup"
+ELEVATION_TIMEOUT = 10
+DEFAULT_ELEVATION = 500
+
+# Lookups are keyed by coordinates snapped to this grid (about 100 m)
+LOOKUP_CELL_DEG = 0.001
+TIMEZONE_CACHE_SIZE = 256
+ELEVATION_CACHE_SIZE = 1024
+
+DATA_ELEVATION_CACHE = f"{DOMAIN}_elevation_cache"
+DATA_DEM_PROVIDER = f"{DOMAIN}_dem_provider"
+
+_finder = None
+_finder_lock = threading.Lock()
+
+
+def _cell(lat: float, lon: float) -> tuple[float, float]:
+    return (
+        round(round(lat / LOOKUP_CELL_DEG) * LOOKUP_CELL_DEG, 6),
+        round(round(lon / LOOKUP_CELL_DEG) * LOOKUP_CELL_DEG, 6),
+    )
+
+
+def _timezone_finder():
+    """The process-wide TimezoneFinder; its polygon data is loaded once, on first use."""
+    global _finder
+    if _finder is None:
+        with _finder_lock:
+            if _finder is None:
+                from timezonefinder import TimezoneFinder
+
+                _finder = TimezoneFinder()
+    return _finder
+
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def _timezone_at(lat: float, lon: float) -> str | None:
+    return _timezone_finder().timezone_at(lat=lat, lng=lon)
+
+
+def timezone_at_sync(lat: float, lon: float) -> str | None:
+    """IANA timezone name at a coordinate (blocking on first use while the finder loads)."""
+    return _timezone_at(*_cell(lat, lon))
+
+
+async def async_resolve_timezone(hass: HomeAssistant, lat: float, lon: float) -> str:
+    """Timezone at a coordinate, falling back to Home Assistant's own."""
+    timezone = await hass.async_add_executor_job(timezone_at_sync, lat, lon)
+    return timezone or hass.config.time_zone
+
+
+class ElevationCache:
+    """LRU of open-elevation results by grid cell; concurrent lookups of a cell share one request."""
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._values: OrderedDict[tuple, float] = OrderedDict()
+        self._pending: dict[tuple, asyncio.Task] = {}
+
+    async def async_get(self, lat: float, lon: float) -> float | None:
+        cell = _cell(lat, lon)
+        if cell in self._values:
+            self._values.move_to_end(cell)
+            return self._values[cell]
+
+        request = self._pending.get(cell)
+        if request is None:
+            request = self._pending[cell] = self.hass.async_create_task(self._async_fetch(*cell))
+            request.add_done_callback(lambda _: self._pending.pop(cell, None))
+        elevation = await asyncio.shield(request)
+
+        if elevation is not None:
+            self._values[cell] = elevation
+            self._values.move_to_end(cell)
+            while len(self._values) > ELEVATION_CACHE_SIZE:
+                self._values.popitem(last=False)
+        return elevation
+
+    async def _async_fetch(self, lat: float, lon: float) -> float | None:
+        session = async_get_clientsession(self.hass)
+        try:
+            async with session.get(
+                ELEVATION_URL,
+                params={"locations": f"{lat},{lon}"},
+                timeout=aiohttp.ClientTimeout(total=ELEVATION_TIMEOUT),
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.warning("Elevation lookup for %s, %s failed: HTTP %s", lat, lon, response.status)
+                    return None
+                data = await response.json()
+            return float(data["results"][0]["elevation"])
+        except Exception as e:
+            _LOGGER.warning("Elevation lookup for %s, %s failed: %s", lat, lon, e)
+            return None
+
+
+def _elevation_cache(hass: HomeAssistant) -> ElevationCache:
+    cache = hass.data.get(DATA_ELEVATION_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_ELEVATION_CACHE] = ElevationCache(hass)
+    return cache
+
+
+async def async_resolve_elevation(hass: HomeAssistant, lat: float, lon: float) -> float | None:
+    """Elevation from local DEM tiles when they cover the point, else from open-elevation."""
+    provider = hass.data.get(DATA_DEM_PROVIDER)
+    if provider is None:
+        provider = hass.data[DATA_DEM_PROVIDER] = DemElevationProvider(hass.config.path(DEM_DIRECTORY))
+
+    elevation = await hass.async_add_executor_job(provider.elevation_at, lat, lon)
+    if elevation is not None:
+        return round(elevation, 1)
+    return await _elevation_cache(hass).async_get(lat, lon)
+
 
-def resolve_location_metadata_sync(lat: float, lon: float) -> dict:
-    """Calculate timezone and elevation for a given lat/lon (sync-safe)."""
-    from homeassistant.util import dt as dt_util
-
-    tf = TimezoneFinder()
-    timezone = tf.timezone_at(lat=lat, lng=lon) or dt_util.DEFAULT_TIME_ZONE
-    elevation = 500
-
-    try:
-        url = f"https://api.open-elevation.com/api/v1/lookup?locations={lat},{lon}"
-        response = httpx.get(url, timeout=10)
-        if response.status_code == 200:
-            result = response.json().get("results", [{}])[0]
-            elevation = result.get("elevation", elevation)
-    except Exception:
-        pass  # Fail silently for now
+async def async_resolve_location_metadata(hass: HomeAssistant, lat: float, lon: float) -> dict:
+    """Timezone and elevation for a lat/lon, resolved concurrently and cached per grid cell."""
+    timezone, elevation = await asyncio.gather(
+        async_resolve_timezone(hass, lat, lon),
+        async_resolve_elevation(hass, lat, lon),
+    )
+    if elevation is None:
+        _LOGGER.warning("No elevation for %s, %s; using %s m", lat, lon, DEFAULT_ELEVATION)
+        elevation = DEFAULT_ELEVATION
 
     return {
         "timezone": timezone,
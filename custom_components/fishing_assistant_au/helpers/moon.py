@@ -0,0 +1,75 @@
+"""Location-independent moon phase, computed once per process per day."""
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict
+import asyncio
+import logging
+
+import numpy as np
+from homeassistant.core import HomeAssistant
+
+from ..executor import async_run_compute
+from ..instrumentation import STATS
+from .astro import AstronomyContext, async_get_astronomy_context
+
+_LOGGER = logging.getLogger(__name__)
+
+# Days before today (UTC) kept in the process-wide table
+KEEP_PAST_DAYS = 2
+
+# {"YYYY-MM-DD": {"moon_phase": ...}}
+_moon_days: Dict[str, dict] = {}
+_computing: asyncio.Future | None = None
+
+
+def compute_moon_days(context: AstronomyContext, start_date: date, days: int) -> Dict[str, dict]:
+    """Moon phase (0 new, 0.5 full) at 12:00 UTC of each day.
+
+    One vectorized Skyfield evaluation covers every day (CPU-bound, blocking).
+    """
+    from skyfield import almanac
+
+    with STATS.timer("moon_phase"):
+        t = context.ts.utc(start_date.year, start_date.month, start_date.day + np.arange(days), 12)
+        phase = almanac.moon_phase(context.eph, t).degrees / 360.0
+
+    return {
+        str(start_date + timedelta(days=i)): {"moon_phase": round(float(phase[i]), 3)}
+        for i in range(days)
+    }
+
+
+async def async_get_moon_days(hass: HomeAssistant, start_date: date, days: int) -> Dict[str, dict]:
+    """Moon data for `days` days from `start_date`, shared by every entry and location."""
+    global _computing
+
+    wanted = [str(start_date + timedelta(days=i)) for i in range(days)]
+    while any(d not in _moon_days for d in wanted):
+        if _computing is not None:
+            # Another caller is filling the table; its result may cover these days too
+            await asyncio.shield(_computing)
+            continue
+
+        missing = [d for d in wanted if d not in _moon_days]
+        first = date.fromisoformat(missing[0])
+        span = (date.fromisoformat(missing[-1]) - first).days + 1
+        _LOGGER.debug("Computing moon phase for %d day(s) from %s", span, first)
+        computing = _computing = hass.loop.create_future()
+        try:
+            context = await async_get_astronomy_context(hass)
+            _moon_days.update(await async_run_compute(hass, compute_moon_days, context, first, span))
+            _prune(keep=wanted)
+            # Return straight away: a later prune may drop past days again
+            return {d: _moon_days[d] for d in wanted}
+        finally:
+            # Waiters re-check the table, and retry themselves if this failed
+            _computing = None
+            computing.set_result(None)
+
+    return {d: _moon_days[d] for d in wanted}
+
+
+def _prune(keep: list[str]) -> None:
+    """Drop days older than KEEP_PAST_DAYS, except the `keep` days just requested."""
+    oldest = str(datetime.now(timezone.utc).date() - timedelta(days=KEEP_PAST_DAYS))
+    for day in [d for d in _moon_days if d < oldest and d not in keep]:
+        del _moon_days[day]
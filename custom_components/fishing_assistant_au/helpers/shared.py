@@ -0,0 +1,27 @@
+"""Process-wide objects kept in hass.data and loaded once on first use."""
+from typing import Awaitable, Callable, TypeVar
+import asyncio
+
+from homeassistant.core import HomeAssistant
+
+_T = TypeVar("_T")
+
+
+async def async_get_shared(hass: HomeAssistant, key: str, load: Callable[[HomeAssistant], Awaitable[_T]]) -> _T:
+    """Return hass.data[key], creating it with `load(hass)` on first use.
+
+    Concurrent first callers await the same load task. A failed load is
+    dropped, so the next caller tries again.
+    """
+    if key not in hass.data:
+        loading = hass.data[key] = hass.async_create_task(load(hass))
+        try:
+            hass.data[key] = await loading
+        except Exception:
+            del hass.data[key]
+            raise
+
+    shared = hass.data[key]
+    if isinstance(shared, asyncio.Task):
+        shared = await asyncio.shield(shared)
+    return shared
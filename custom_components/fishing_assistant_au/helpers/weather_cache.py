@@ -0,0 +1,167 @@
+"""Persistent Open-Meteo response cache that survives restarts."""
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from ..const import (
+    DOMAIN,
+    MODEL_RUN_AVAILABILITY_DELAY,
+    MODEL_RUN_HOURS_UTC,
+    WEATHER_CACHE_MAX_ENTRIES,
+    WEATHER_CACHE_STORAGE_KEY,
+    WEATHER_CACHE_STORAGE_VERSION,
+)
+from .shared import async_get_shared
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_WEATHER_CACHE = f"{DOMAIN}_weather_cache"
+SAVE_DELAY = 30
+TIME_FORMAT = "%Y-%m-%dT%H:%M"
+
+
+def next_model_update(after: datetime) -> datetime:
+    """Return when the next upstream model run should be available after `after` (UTC)."""
+    day = after.date()
+    for offset in range(3):
+        for hour in MODEL_RUN_HOURS_UTC:
+            available = datetime(
+                day.year, day.month, day.day, hour, tzinfo=timezone.utc
+            ) + timedelta(days=offset) + MODEL_RUN_AVAILABILITY_DELAY
+            if available > after:
+                return available
+    return after + timedelta(hours=6)
+
+
+def _pack_hourly(hourly: dict) -> dict:
+    """Store hourly columns as lists; a contiguous hourly time axis becomes (t0, n)."""
+    times = hourly["time"]
+    columns = {k: v for k, v in hourly.items() if k != "time"}
+    if times:
+        t0 = datetime.strptime(times[0], TIME_FORMAT)
+        expected = [(t0 + timedelta(hours=i)).strftime(TIME_FORMAT) for i in range(len(times))]
+        if expected == times:
+            return {"t0": times[0], "n": len(times), "columns": columns}
+    return {"time": times, "columns": columns}
+
+
+def _unpack_hourly(packed: dict) -> dict:
+    if "time" in packed:
+        times = packed["time"]
+    else:
+        t0 = datetime.strptime(packed["t0"], TIME_FORMAT)
+        times = [(t0 + timedelta(hours=i)).strftime(TIME_FORMAT) for i in range(packed["n"])]
+    return {"time": times, **packed["columns"]}
+
+
+class CachedWeather:
+    """One cached forecast and whether it is still within its model-run validity."""
+
+    def __init__(self, data: dict, fetched_at: datetime, valid_until: datetime):
+        self.data = data
+        self.fetched_at = fetched_at
+        self.valid_until = valid_until
+
+    @property
+    def fresh(self) -> bool:
+        return datetime.now(timezone.utc) < self.valid_until
+
+    @property
+    def age(self) -> timedelta:
+        return datetime.now(timezone.utc) - self.fetched_at
+
+
+class WeatherCache:
+    """Open-Meteo forecasts keyed by location, stored columnar in .storage.
+
+    An entry stays valid until the next upstream model run is expected to be
+    published, so restarts and extra refreshes inside that window cost no
+    upstream calls. Entries whose horizon has passed are dropped on load, and
+    the least recently used once there are more than WEATHER_CACHE_MAX_ENTRIES.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._store = Store(hass, WEATHER_CACHE_STORAGE_VERSION, WEATHER_CACHE_STORAGE_KEY)
+        self._entries: Dict[str, dict] = {}
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        if stored:
+            self._entries = stored.get("entries", {})
+        today = str(date.today())
+        self._entries = {k: v for k, v in self._entries.items() if v["end_date"] >= today}
+        self._evict()
+
+    @staticmethod
+    def _key(lat: float, lon: float, timezone_name: str, elevation: float) -> str:
+        return f"{lat:.4f},{lon:.4f},{elevation},{timezone_name}"
+
+    def get(
+        self, lat: float, lon: float, timezone_name: str, elevation: float, start_date: date, end_date: date
+    ) -> CachedWeather | None:
+        entry = self._entries.get(self._key(lat, lon, timezone_name, elevation))
+        if not entry or entry["start_date"] != str(start_date) or entry["end_date"] != str(end_date):
+            return None
+        return self._cached(entry)
+
+    def latest(self, lat: float, lon: float, timezone_name: str, elevation: float) -> CachedWeather | None:
+        """The stored forecast for a location whatever its horizon; the fallback while upstream fails."""
+        entry = self._entries.get(self._key(lat, lon, timezone_name, elevation))
+        return self._cached(entry) if entry else None
+
+    @staticmethod
+    def _cached(entry: dict) -> CachedWeather:
+        entry["last_used"] = datetime.now(timezone.utc).isoformat()
+        return CachedWeather(
+            {"hourly": _unpack_hourly(entry["hourly"]), "daily": entry.get("daily", {})},
+            datetime.fromisoformat(entry["fetched_at"]),
+            datetime.fromisoformat(entry["valid_until"]),
+        )
+
+    def set(
+        self,
+        lat: float,
+        lon: float,
+        timezone_name: str,
+        elevation: float,
+        start_date: date,
+        end_date: date,
+        data: dict,
+    ) -> CachedWeather:
+        now = datetime.now(timezone.utc)
+        entry = self._entries[self._key(lat, lon, timezone_name, elevation)] = {
+            "start_date": str(start_date),
+            "end_date": str(end_date),
+            "fetched_at": now.isoformat(),
+            "valid_until": next_model_update(now).isoformat(),
+            "last_used": now.isoformat(),
+            "hourly": _pack_hourly(data["hourly"]),
+            "daily": data.get("daily", {}),
+        }
+        self._evict()
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return CachedWeather(data, now, datetime.fromisoformat(entry["valid_until"]))
+
+    def _evict(self) -> None:
+        if len(self._entries) > WEATHER_CACHE_MAX_ENTRIES:
+            by_use = sorted(self._entries, key=lambda k: self._entries[k].get("last_used", ""))
+            for key in by_use[:len(self._entries) - WEATHER_CACHE_MAX_ENTRIES]:
+                del self._entries[key]
+
+    def _data_to_save(self) -> dict:
+        return {"entries": self._entries}
+
+
+async def async_get_weather_cache(hass: HomeAssistant) -> WeatherCache:
+    """Return the process-wide weather cache, loading it from disk on first use."""
+    return await async_get_shared(hass, DATA_WEATHER_CACHE, _async_load_cache)
+
+
+async def _async_load_cache(hass: HomeAssistant) -> WeatherCache:
+    cache = WeatherCache(hass)
+    await cache.async_load()
+    return cache
@@ -0,0 +1,99 @@
+"""Hot-path stage timers and cache counters for diagnostics."""
+from collections import deque
+from contextlib import contextmanager, nullcontext
+import time
+
+# Samples kept per stage for the rolling percentiles
+WINDOW = 256
+
+STAGES = (
+    "refresh",
+    "fetch",
+    "json_decode",
+    "ephemeris_load",
+    "astronomy",
+    "frame_build",
+    "scoring",
+    "window_search",
+)
+
+_NULL_TIMER = nullcontext()
+
+
+class PerfStats:
+    """Process-wide rolling stage timings and hit/miss counters.
+
+    Collection is off unless some owner (an entry with the instrumentation
+    option, or an enabled diagnostic sensor) turned it on; while off, timers
+    are a shared no-op context manager and counters return immediately.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._owners: set[str] = set()
+        self._samples: dict[str, deque] = {}
+        self._counters: dict[str, int] = {}
+
+    def enable(self, owner: str) -> None:
+        self._owners.add(owner)
+        self.enabled = True
+
+    def disable(self, owner: str) -> None:
+        self._owners.discard(owner)
+        self.enabled = bool(self._owners)
+
+    def timer(self, stage: str):
+        """Context manager timing one run of `stage` (no-op when disabled)."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return self._timed(stage)
+
+    @contextmanager
+    def _timed(self, stage: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples.setdefault(stage, deque(maxlen=WINDOW))
+        samples.append(seconds)
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        if not self.enabled:
+            return
+        self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    def summary(self) -> dict:
+        """Rolling percentiles in milliseconds per stage, plus counters."""
+        stages = {}
+        for stage in (*STAGES, *sorted(set(self._samples) - set(STAGES))):
+            samples = sorted(self._samples.get(stage, ()))
+            if not samples:
+                continue
+            stages[stage] = {
+                "count": len(samples),
+                "p50_ms": round(_percentile(samples, 50) * 1000, 3),
+                "p90_ms": round(_percentile(samples, 90) * 1000, 3),
+                "p99_ms": round(_percentile(samples, 99) * 1000, 3),
+                "max_ms": round(samples[-1] * 1000, 3),
+            }
+        return {
+            "enabled": self.enabled,
+            "window": WINDOW,
+            "stages": stages,
+            "counters": dict(sorted(self._counters.items())),
+        }
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+STATS = PerfStats()
@@ -0,0 +1,158 @@
+"""Species profiles compiled into columnar arrays for batched scoring."""
+import json
+import logging
+import os
+
+import numpy as np
+import voluptuous as vol
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN
+from .fish_profiles import FISH_PROFILES
+
+_LOGGER = logging.getLogger(__name__)
+
+BODY_TYPES = ("lake", "river", "pond", "reservoir")
+COMPONENTS = ("temp", "cloud", "pressure", "wind", "precip", "twilight", "solunar", "moon")
+
+# Extra profiles are read from the first of these in the HA config directory
+USER_PROFILE_FILES = ("fishing_assistant_profiles.yaml", "fishing_assistant_profiles.json")
+
+DATA_PROFILE_TABLE = f"{DOMAIN}_profile_table"
+
+
+def _temp_range(value):
+    low, high = vol.ExactSequence([vol.Coerce(float), vol.Coerce(float)])(list(value))
+    if low >= high:
+        raise vol.Invalid("temp_range must be [low, high] with low < high")
+    return (low, high)
+
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required("temp_range"): _temp_range,
+        vol.Required("ideal_cloud"): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+        vol.Optional("prefers_low_pressure", default=False): cv.boolean,
+    }
+)
+PROFILES_SCHEMA = vol.Schema({cv.slug: PROFILE_SCHEMA})
+
+
+def get_profile_weights(body_type: str) -> dict:
+    if body_type not in BODY_TYPES:
+        _LOGGER.warning("Unknown body_type '%s', defaulting to 'lake'.", body_type)
+        body_type = "lake"
+
+    weights = {
+        "temp": 0.25,
+        "cloud": 0.1,
+        "pressure": 0.15,
+        "wind": 0.1,
+        "precip": 0.1,
+        "twilight": 0.15,
+        "solunar": 0.1,
+        "moon": 0.05,
+    }
+
+    if body_type == "river":
+        weights.update({
+            "pressure": 0.05,
+            "solunar": 0.05,
+            "precip": 0.2,
+        })
+    elif body_type == "pond":
+        weights.update({
+            "temp": 0.3,
+            "precip": 0.2,
+            "pressure": 0.2,
+        })
+    elif body_type == "reservoir":
+        weights.update({
+            "pressure": 0.1,
+            "solunar": 0.08,
+            "moon": 0.07,
+        })
+
+    return weights
+
+
+# One row per body type, columns in COMPONENTS order
+BODY_TYPE_WEIGHTS = np.array(
+    [[get_profile_weights(body_type)[name] for name in COMPONENTS] for body_type in BODY_TYPES]
+)
+
+
+class ProfileTable:
+    """Struct-of-arrays view of the species profiles: one array per field, one row per species."""
+
+    def __init__(self, profiles: dict[str, dict]):
+        self.names = tuple(profiles)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.temp_low = np.array([p["temp_range"][0] for p in profiles.values()], dtype=float)
+        self.temp_high = np.array([p["temp_range"][1] for p in profiles.values()], dtype=float)
+        self.ideal_cloud = np.array([p["ideal_cloud"] for p in profiles.values()], dtype=float)
+        self.prefers_low_pressure = np.array(
+            [bool(p.get("prefers_low_pressure", False)) for p in profiles.values()], dtype=bool
+        )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def rows(self, species: list[str]) -> np.ndarray:
+        return np.array([self.index[name] for name in species], dtype=np.intp)
+
+    @staticmethod
+    def weights(body_type: str) -> np.ndarray:
+        """Component weight vector for a body type (unknown types fall back to lake)."""
+        if body_type not in BODY_TYPES:
+            _LOGGER.warning("Unknown body_type '%s', defaulting to 'lake'.", body_type)
+            body_type = "lake"
+        return BODY_TYPE_WEIGHTS[BODY_TYPES.index(body_type)]
+
+
+BUILTIN_PROFILE_TABLE = ProfileTable(FISH_PROFILES)
+
+
+def load_user_profiles(config_dir: str) -> dict[str, dict]:
+    """Read and validate the user profile file, if any (blocking)."""
+    from homeassistant.util.yaml import load_yaml
+
+    for filename in USER_PROFILE_FILES:
+        path = os.path.join(config_dir, filename)
+        if not os.path.exists(path):
+            continue
+        try:
+            if filename.endswith(".json"):
+                with open(path, encoding="utf-8") as f:
+                    raw = json.load(f)
+            else:
+                raw = load_yaml(path) or {}
+            return PROFILES_SCHEMA(raw)
+        except (HomeAssistantError, OSError, ValueError, vol.Invalid) as e:
+            _LOGGER.error("Ignoring fish profiles in %s: %s", path, e)
+            return {}
+    return {}
+
+
+def build_profile_table(user_profiles: dict[str, dict]) -> ProfileTable:
+    """Built-in profiles merged with validated user profiles, which win on name clashes."""
+    if not user_profiles:
+        return BUILTIN_PROFILE_TABLE
+    overridden = sorted(set(user_profiles) & set(FISH_PROFILES))
+    if overridden:
+        _LOGGER.info("User fish profiles override built-in: %s", ", ".join(overridden))
+    return ProfileTable({**FISH_PROFILES, **user_profiles})
+
+
+async def async_get_profile_table(hass: HomeAssistant) -> ProfileTable:
+    """Built-in profiles merged with the user's, compiled once and shared by all entries."""
+    table = hass.data.get(DATA_PROFILE_TABLE)
+    if table is None:
+        user_profiles = await hass.async_add_executor_job(load_user_profiles, hass.config.config_dir)
+        table = hass.data[DATA_PROFILE_TABLE] = build_profile_table(user_profiles)
+    return table
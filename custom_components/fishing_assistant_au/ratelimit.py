@@ -0,0 +1,216 @@
+"""Process-wide budget and priority scheduling for Open-Meteo calls.
+
+Open-Meteo's free tier allows 600 calls a minute, 5,000 an hour and 10,000
+a day, and counts every location in a multi-location call as one call. All
+outbound forecast calls wait here for tokens: a token bucket paces them well
+inside the minute and hour limits, and a daily budget keeps a reserve for
+urgent requests so background work stops first as it runs low.
+"""
+from datetime import datetime, timezone
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, REQUEST_BUDGET_STORAGE_KEY, REQUEST_BUDGET_STORAGE_VERSION
+from .helpers.shared import async_get_shared
+from .instrumentation import STATS
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SCHEDULER = f"{DOMAIN}_request_scheduler"
+SAVE_DELAY = 60
+
+# Lower runs first: first loads, stale entries and service calls, then
+# scheduled refreshes, then locations prefetched ahead of their refresh
+PRIORITY_URGENT = 0
+PRIORITY_REFRESH = 1
+PRIORITY_PREFETCH = 2
+
+# Tokens (locations) per second and bucket size: 3,600 an hour at most
+TOKEN_RATE = 1.0
+TOKEN_BURST = 60
+DAILY_BUDGET = 10_000
+# Share of the daily budget each priority must leave for the ones above it
+BUDGET_RESERVE = {PRIORITY_URGENT: 0.0, PRIORITY_REFRESH: 0.05, PRIORITY_PREFETCH: 0.25}
+# Pause after a 429 without a Retry-After header (seconds)
+DEFAULT_RETRY_AFTER = 60
+# Longest a call may wait for tokens before its caller falls back to the
+# cached forecast instead (seconds)
+MAX_WAIT = {PRIORITY_URGENT: 10, PRIORITY_REFRESH: 120, PRIORITY_PREFETCH: 60}
+
+
+class RequestScheduler:
+    """Token bucket with a strict priority queue and a daily budget (UTC days).
+
+    The budget used today is persisted, so restarts do not reset it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = TOKEN_RATE,
+        burst: int = TOKEN_BURST,
+        daily_budget: int = DAILY_BUDGET,
+    ):
+        self.hass = hass
+        self.rate = rate
+        self.burst = burst
+        self.daily_budget = daily_budget
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._day = datetime.now(timezone.utc).date()
+        self._used_today = 0
+        self._queue: list[tuple[int, int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._store = Store(hass, REQUEST_BUDGET_STORAGE_VERSION, REQUEST_BUDGET_STORAGE_KEY)
+
+    async def async_load(self) -> None:
+        stored = await self._store.async_load()
+        if stored and stored.get("day") == str(self._day):
+            self._used_today = stored.get("used", 0)
+
+    def allows(self, cost: int, priority: int) -> bool:
+        """Whether the daily budget left for `priority` covers `cost` more locations."""
+        self._roll_day()
+        limit = self.daily_budget * (1 - BUDGET_RESERVE[priority])
+        return self._used_today + cost <= limit
+
+    async def async_acquire(self, cost: int, priority: int) -> bool:
+        """Wait until a call costing `cost` locations may go out.
+
+        False if over budget, or if the call would wait longer than
+        MAX_WAIT for its priority (e.g. while paused after a 429).
+        """
+        if not self.allows(cost, priority):
+            STATS.count("open_meteo.budget_denied")
+            _LOGGER.debug("Daily Open-Meteo budget left for priority %d cannot cover %d location(s)", priority, cost)
+            return False
+
+        max_wait = MAX_WAIT[priority]
+        wait = self._expected_wait(cost, priority)
+        if wait > max_wait:
+            STATS.count("open_meteo.wait_denied")
+            _LOGGER.debug("Open-Meteo call for %d location(s) would wait %.0f s, not queueing it", cost, wait)
+            return False
+
+        future = self.hass.loop.create_future()
+        heapq.heappush(self._queue, (priority, next(self._order), cost, future))
+        # Requests queued later at a higher priority, or a 429, can still push it back
+        deadline = self.hass.loop.call_later(max_wait, self._expire, future)
+        self._dispatch()
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Drop out of the queue; _dispatch skips futures that are done
+            future.cancel()
+            raise
+        finally:
+            deadline.cancel()
+
+    @callback
+    def pause(self, seconds: float) -> None:
+        """Stop dispatching for `seconds`, e.g. after a 429 from upstream."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        STATS.count("open_meteo.rate_limited")
+        _LOGGER.warning("Open-Meteo rate limit hit, pausing requests for %.0f s", seconds)
+        self._dispatch()
+
+    def snapshot(self) -> dict:
+        """Queue depth and budget, for diagnostics."""
+        self._roll_day()
+        self._refill()
+        return {
+            "queue_depth": sum(1 for *_, future in self._queue if not future.done()),
+            "tokens": round(self._tokens, 1),
+            "daily_budget": self.daily_budget,
+            "used_today": self._used_today,
+            "remaining_today": max(0, self.daily_budget - self._used_today),
+            "paused_for_s": round(max(0.0, self._paused_until - time.monotonic()), 1),
+        }
+
+    def _expected_wait(self, cost: int, priority: int) -> float:
+        """Seconds until a call queued now at `priority` would get its tokens."""
+        self._refill()
+        # Everything already queued at this priority or above goes out first
+        needed = min(cost, self.burst) + sum(
+            min(queued_cost, self.burst)
+            for queued_priority, _, queued_cost, future in self._queue
+            if queued_priority <= priority and not future.done()
+        )
+        paused = max(0.0, self._paused_until - time.monotonic())
+        return paused + max(0.0, needed - self._tokens) / self.rate
+
+    @callback
+    def _expire(self, future: asyncio.Future) -> None:
+        if not future.done():
+            STATS.count("open_meteo.wait_denied")
+            future.set_result(False)
+
+    def _roll_day(self) -> None:
+        today = datetime.now(timezone.utc).date()
+        if today != self._day:
+            self._day = today
+            self._used_today = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now > self._paused_until:
+            since = max(self._updated, self._paused_until)
+            self._tokens = min(float(self.burst), self._tokens + (now - since) * self.rate)
+        self._updated = now
+
+    @callback
+    def _dispatch(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        self._refill()
+
+        while self._queue:
+            priority, _, cost, future = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+
+            wait = self._paused_until - time.monotonic()
+            if wait <= 0:
+                # A call larger than the bucket goes out once the bucket is full
+                needed = min(cost, self.burst)
+                if self._tokens < needed:
+                    wait = (needed - self._tokens) / self.rate
+            if wait > 0:
+                self._wakeup = self.hass.loop.call_later(wait, self._dispatch)
+                return
+
+            heapq.heappop(self._queue)
+            # The budget may have been spent while this request waited
+            if not self.allows(cost, priority):
+                STATS.count("open_meteo.budget_denied")
+                future.set_result(False)
+                continue
+            self._tokens -= min(cost, self.burst)
+            self._used_today += cost
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            future.set_result(True)
+
+    def _data_to_save(self) -> dict:
+        return {"day": str(self._day), "used": self._used_today}
+
+
+async def async_get_request_scheduler(hass: HomeAssistant) -> RequestScheduler:
+    """Return the process-wide scheduler, loading today's used budget on first use."""
+    return await async_get_shared(hass, DATA_SCHEDULER, _async_load_scheduler)
+
+
+async def _async_load_scheduler(hass: HomeAssistant) -> RequestScheduler:
+    scheduler = RequestScheduler(hass)
+    await scheduler.async_load()
+    return scheduler
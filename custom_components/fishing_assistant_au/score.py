@@ -1,15 +1,27 @@
 from homeassistant.core import HomeAssistant
 import datetime
 from typing import Dict
-import aiohttp
-import pandas as pd
+import math
+import numpy as np
 import logging
 
 
-from .fish_profiles import FISH_PROFILES
-from .helpers.astro import calculate_astronomy_forecast
+from .api import forecast_dates, get_forecast_data
+from .helpers.astro import NO_EVENT, LocalAstronomy, localize_astronomy
+from .helpers.astro_cache import async_get_astronomy_cache
+from .helpers.grid import weather_cell
+from .helpers.weather_cache import CachedWeather, async_get_weather_cache
+from .const import (
+    DEFAULT_ASTRONOMY_CELL_DEG,
+    DEFAULT_TOP_K,
+    DEFAULT_WEATHER_CELL_DEG,
+    DEFAULT_WINDOW_HOURS,
+)
+from .instrumentation import STATS
+from .ratelimit import PRIORITY_REFRESH
+from .profile_table import BUILTIN_PROFILE_TABLE, COMPONENTS, ProfileTable
+from .windows import top_k_windows, window_sums
 
-OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -18,158 +30,228 @@ def scale_score(score):
     return max(0, min(10, round(stretched)))
 
 
-def get_profile_weights(body_type: str) -> dict:
-    if body_type not in ["lake", "river", "pond", "reservoir"]:
-        _LOGGER.warning(f"Unknown body_type '{body_type}', defaulting to 'lake'.")
-        body_type = "lake"
-
-    weights = {
-        "temp": 0.25,
-        "cloud": 0.1,
-        "pressure": 0.15,
-        "wind": 0.1,
-        "precip": 0.1,
-        "twilight": 0.15,
-        "solunar": 0.1,
-        "moon": 0.05,
-    }
-
-    if body_type == "river":
-        weights.update({
-            "pressure": 0.05,
-            "solunar": 0.05,
-            "precip": 0.2,
-        })
-    elif body_type == "pond":
-        weights.update({
-            "temp": 0.3,
-            "precip": 0.2,
-            "pressure": 0.2,
-        })
-    elif body_type == "reservoir":
-        weights.update({
-            "pressure": 0.1,
-            "solunar": 0.08,
-            "moon": 0.07,
-        })
-
-    return weights
-
-
-async def get_fish_score_forecast(
+async def get_location_forecast_data(
     hass: HomeAssistant,
-    fish: str,
     lat: float,
     lon: float,
     timezone: str,
     elevation: float,
+    allow_stale: bool = False,
+    weather_cell_deg: float = DEFAULT_WEATHER_CELL_DEG,
+    astronomy_cell_deg: float = DEFAULT_ASTRONOMY_CELL_DEG,
+    priority: int = PRIORITY_REFRESH,
+) -> dict | None:
+    """Fetch the weather and astronomy shared by every species at one location.
+
+    The location is snapped to a weather cell and an astronomy cell, so every
+    entry in the same cell shares one fetch and one computation. Weather comes
+    from the persistent cache while it is within its model-run validity. With
+    allow_stale, whatever is stored for the location is returned as-is (flagged
+    "stale"), even an expired entry or one for an older horizon, instead of
+    going upstream. If upstream fails, the last stored forecast is
+    returned, also flagged "stale". `priority` orders the upstream call
+    against others when the request budget is short.
+
+    Astronomy comes back converted to the location's `timezone`, so the
+    scorers compare it with the local hours of the weather forecast.
+    """
+    today, end_date = forecast_dates()
+    days = (end_date - today).days + 1
+
+    # Get moon + sun event timings, computing only days not cached yet. The
+    # UTC days either side cover local days that start before or end after
+    # the UTC ones.
+    astro_cache = await async_get_astronomy_cache(hass)
+    utc_astro = await astro_cache.async_get_forecast(
+        lat, lon, days=days + 2, cell_deg=astronomy_cell_deg, start_date=today - datetime.timedelta(days=1)
+    )
+
+    if not utc_astro:
+        return None
+    astro_data = localize_astronomy(utc_astro, timezone, today, days)
+
+    cell = weather_cell(lat, lon, elevation, weather_cell_deg)
+    weather_cache = await async_get_weather_cache(hass)
+    cached = weather_cache.get(cell.lat, cell.lon, timezone, cell.elevation, today, end_date)
+    if cached and cached.fresh:
+        STATS.count("weather_cache.hit")
+        _LOGGER.debug("Using cached weather for %s, %s (age %s)", cell.lat, cell.lon, cached.age)
+        return _location_data(cached, astro_data)
+    if allow_stale:
+        # Render whatever is stored straight away, even a horizon that started
+        # on an earlier day (a restart after midnight); the caller revalidates
+        stored = cached or weather_cache.latest(cell.lat, cell.lon, timezone, cell.elevation)
+        if stored:
+            STATS.count("weather_cache.stale_hit")
+            _LOGGER.debug("Using stale cached weather for %s, %s (age %s)", cell.lat, cell.lon, stored.age)
+            return _location_data(stored, astro_data, stale=True)
+
+    STATS.count("weather_cache.miss")
+    data = await get_forecast_data(
+        hass, cell.lat, cell.lon, timezone, cell.elevation, today, end_date, priority
+    )
+    if not data:
+        # Keep serving the last good forecast while upstream is failing
+        cached = weather_cache.latest(cell.lat, cell.lon, timezone, cell.elevation)
+        if not cached:
+            return None
+        STATS.count("weather_cache.fallback")
+        _LOGGER.debug("Open-Meteo failed for %s, %s; serving weather from %s", cell.lat, cell.lon, cached.fetched_at)
+        return _location_data(cached, astro_data, stale=True)
+
+    return _location_data(
+        weather_cache.set(cell.lat, cell.lon, timezone, cell.elevation, today, end_date, data), astro_data
+    )
+
+
+def _location_data(cached: CachedWeather, astro_data: LocalAstronomy, stale: bool = False) -> dict:
+    return {
+        "weather": cached.data,
+        "astro": astro_data,
+        "stale": stale or not cached.fresh,
+        "fetched_at": cached.fetched_at,
+    }
+
+
+def build_location_forecast(
+    weather: dict,
+    astro_data: LocalAstronomy,
     body_type: str,
-) -> Dict[str, Dict[str, str | float]]:
-    fish_profile = FISH_PROFILES.get(fish)
-    if not fish_profile:
-        _LOGGER.warning(f"No fish profile found for '{fish}'")
-        return {}
-
-    today = datetime.date.today()
-    end_date = today + datetime.timedelta(days=6)
-
-    # Get moon + sun event timings from Skyfield
-    astro_data = await calculate_astronomy_forecast(hass, lat, lon, days=7)
-
-    if not astro_data:
-        return {}
-
-    try:
-        # Log the exact values being sent to the API
-        _LOGGER.debug(f"Making Open-Meteo API request with lat={lat} ({type(lat)}), lon={lon} ({type(lon)})")
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "hourly": "temperature_2m,cloudcover,pressure_msl,precipitation,windspeed_10m",
-            "daily": "sunrise,sunset",
-            "timezone": timezone,
-            "elevation": elevation,
-            "start_date": str(today),
-            "end_date": str(end_date)
-        }
-        _LOGGER.debug(f"Full API parameters: {params}")
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                OPEN_METEO_URL,
-                params={
-                    "latitude": lat,
-                    "longitude": lon,
-                    "hourly": "temperature_2m,cloudcover,pressure_msl,precipitation,windspeed_10m",
-                    "daily": "sunrise,sunset",
-                    "timezone": timezone,
-                    "elevation": elevation,
-                    "start_date": str(today),
-                    "end_date": str(end_date)
-                },
-                timeout=aiohttp.ClientTimeout(total=15)
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    _LOGGER.error(f"Open-Meteo API error: Status {response.status}, Response: {error_text}")
-                    return {}
-
-                data = await response.json()
-                _LOGGER.debug(f"Open-Meteo response: {data}")
-                if "hourly" not in data or "daily" not in data:
-                    _LOGGER.warning(f"Fishing forecast fetch failed for {fish} at {lat}, {lon}: {data}")
-                    return {}
-    except Exception as e:
-        _LOGGER.error(f"Exception while fetching Open-Meteo data: {e}")
-        return {}
+    species: list[str] | None = None,
+    window_hours: int = DEFAULT_WINDOW_HOURS,
+    top_k: int = DEFAULT_TOP_K,
+    table: ProfileTable = BUILTIN_PROFILE_TABLE,
+) -> dict:
+    """Build the hourly arrays and score species (CPU-bound; run via async_run_compute)."""
+    with STATS.timer("frame_build"):
+        hourly = build_hourly_arrays(weather)
+    forecasts, top_windows = score_species_windows(
+        hourly, astro_data, body_type, species, window_hours, top_k, table
+    )
+    return {
+        "hourly": hourly,
+        "astro": astro_data,
+        "forecasts": forecasts,
+        "top_windows": top_windows,
+    }
+
 
+# Columnar hourly data: one NumPy array per variable, all the same length
+HourlyArrays = Dict[str, np.ndarray]
+
+
+def build_hourly_arrays(data: dict) -> HourlyArrays:
     # Units: temp °C, cloud %, pressure hPa, wind km/h, precip mm
-    hourly = pd.DataFrame({
-        "datetime": pd.to_datetime(data["hourly"]["time"]),
-        "temp": data["hourly"]["temperature_2m"],
-        "cloud": data["hourly"]["cloudcover"],
-        "pressure": data["hourly"]["pressure_msl"],
-        "precip": data["hourly"]["precipitation"],
-        "wind": data["hourly"]["windspeed_10m"]
-    })
-
-    hourly["date"] = hourly["datetime"].dt.date
-    hourly["hour"] = hourly["datetime"].dt.hour
-    hourly["pressure_trend"] = hourly["pressure"].diff()
-
-    forecast = {}
-    weights = get_profile_weights(body_type)
-
-
-    for date, group in hourly.groupby("date"):
-        date_str = str(date)
-        scores = []
-        astro = astro_data.get(date_str, {})
-
-        for _, row in group.iterrows():
-            score = _score_hour(row=row, profile=fish_profile, astro=astro, weights=weights)
-            scores.append((row["hour"], score))
-
-        # Best 3-hour rolling window
-        best_avg = 0
-        best_window = ("--:--", "--:--")
-        for i in range(len(scores) - 2):
-            avg = (scores[i][1] + scores[i+1][1] + scores[i+2][1]) / 3
-            if avg > best_avg:
-                best_avg = avg
-                best_window = (f"{scores[i][0]:02}:00", f"{scores[i+2][0]:02}:00")
-
-        forecast[date_str] = {
-            "score": scale_score(best_avg),
-            "best_window": f"{best_window[0]} – {best_window[1]}"
+    raw = data["hourly"]
+    times = np.array(raw["time"], dtype="datetime64[m]")
+    pressure = np.array(raw["pressure_msl"], dtype=float)
+
+    return {
+        "datetime": times,
+        "hour": ((times - times.astype("datetime64[D]")) // np.timedelta64(1, "h")).astype(int),
+        "temp": np.array(raw["temperature_2m"], dtype=float),
+        "cloud": np.array(raw["cloudcover"], dtype=float),
+        "pressure": pressure,
+        "precip": np.array(raw["precipitation"], dtype=float),
+        "wind": np.array(raw["windspeed_10m"], dtype=float),
+        "pressure_trend": np.concatenate(([np.nan], np.diff(pressure))),
+    }
+
+
+def score_species_windows(
+    hourly: HourlyArrays,
+    astro_data: LocalAstronomy,
+    body_type: str,
+    species: list[str] | None = None,
+    window_hours: int = DEFAULT_WINDOW_HOURS,
+    top_k: int = DEFAULT_TOP_K,
+    table: ProfileTable = BUILTIN_PROFILE_TABLE,
+) -> tuple[Dict[str, Dict[str, dict]], Dict[str, list[dict]]]:
+    """Per-day forecasts plus the top-k windows over the whole horizon, per species.
+
+    Each day reports the best window starting that day as "score"/"best_window"
+    and its top-k non-overlapping windows under "windows"; windows may cross
+    midnight into the next day.
+    """
+    if species is None:
+        species = list(table.names)
+
+    known = []
+    for fish in species:
+        if fish in table:
+            known.append(fish)
+        else:
+            _LOGGER.warning("No fish profile found for '%s'", fish)
+    if not known:
+        return {}, {}
+
+    days, day_index = _day_index(hourly)
+    with STATS.timer("scoring"):
+        scores = score_table(hourly, astro_data, table, table.rows(known), table.weights(body_type))
+
+    step = _sample_minutes(hourly)
+    length = max(1, round(window_hours * 60 / step))
+    with STATS.timer("window_search"):
+        daily, horizon = best_windows(scores, day_index, len(days), length, top_k)
+
+    times = hourly["datetime"]
+
+    def describe(s: int, start: int) -> dict:
+        # Summed in sample order so a 3-hour window matches (a + b + c) / 3 exactly
+        average = sum(scores[s, start:start + length].tolist()) / length
+        end = times[start] + np.timedelta64(length * step, "m")
+        return {
+            "start": str(times[start]),
+            "end": str(end),
+            "average": average,
+            "score": scale_score(average),
         }
-        
-    _LOGGER.debug(f"Forecast for {fish} on {lat},{lon}: {forecast}")
 
-    return forecast
+    forecasts = {fish: {} for fish in known}
+    top_windows = {fish: [] for fish in known}
+    for s, fish in enumerate(known):
+        for d, date_str in enumerate(days):
+            windows = [describe(s, int(start)) for start in daily[s, d] if start >= 0]
+            best_window = ("--:--", "--:--")
+            if windows:
+                start = int(daily[s, d, 0])
+                # Shown as first to last sample, e.g. 06:00 – 08:00 for 06:00-09:00
+                best_window = (str(times[start])[11:16], str(times[start + length - 1])[11:16])
+
+            forecasts[fish][date_str] = {
+                "score": windows[0]["score"] if windows else scale_score(0),
+                "best_window": f"{best_window[0]} – {best_window[1]}",
+                "windows": [_public_window(w) for w in windows],
+            }
+        top_windows[fish] = [
+            _public_window(describe(s, int(start))) for start in horizon[s] if start >= 0
+        ]
+
+    return forecasts, top_windows
+
+
+def best_windows(
+    scores: np.ndarray, day_index: np.ndarray, n_days: int, length: int = 3, top_k: int = 1
+) -> tuple[np.ndarray, np.ndarray]:
+    """Top-k non-overlapping `length`-sample windows per species and day, and over the horizon.
+
+    Returns start indices shaped (species, days, k) and (species, k), -1 where
+    no window has a positive average. Windows are ranked on exact integer sums of
+    the 2-decimal hourly scores, so ties resolve to the earliest start.
+    """
+    sums = window_sums(np.rint(scores * 100).astype(np.int64), length)
+    starts_day = day_index[:sums.shape[1]]
+    daily = top_k_windows(sums, length, top_k, starts_day, n_days)
+    horizon = top_k_windows(sums, length, top_k)[:, 0, :]
+    return daily, horizon
+
+
+def _public_window(window: dict) -> dict:
+    return {"start": window["start"], "end": window["end"], "score": window["score"]}
 
 
 def _score_hour(row, profile, astro, weights: dict) -> float:
+    """Score one hourly row; `astro` is that day's LocalAstronomy.day()."""
     hour = row["hour"]
 
     temp_score = _score_temp(row["temp"], profile["temp_range"])
@@ -178,14 +260,14 @@ def _score_hour(row, profile, astro, weights: dict) -> float:
     wind_score = _score_wind(row["wind"])
     precip_score = _score_precip(row["precip"])
 
-    # Astro events
-    sunrise = _parse_time(astro.get("sunrise"))
-    sunset = _parse_time(astro.get("sunset"))
+    # Astro events, as minutes since local midnight
+    sunrise = astro.get("sunrise")
+    sunset = astro.get("sunset")
     moon_phase = astro.get("moon_phase", 0.5)
-    transit = _parse_time(astro.get("moon_transit", None))
-    underfoot = _parse_time(astro.get("moon_underfoot"))
-    moonrise = _parse_time(astro.get("moonrise"))
-    moonset = _parse_time(astro.get("moonset"))
+    transit = astro.get("moon_transit")
+    underfoot = astro.get("moon_underfoot")
+    moonrise = astro.get("moonrise")
+    moonset = astro.get("moonset")
 
     twilight_score = _score_twilight(hour, sunrise, sunset)
     moon_score = _score_moon_phase(moon_phase)
@@ -217,7 +299,7 @@ def _score_temp(temp: float, ideal_range: tuple[float, float]) -> float:
     return 1.0
 
 def _score_pressure_trend(trend: float) -> float:
-    if pd.isna(trend):
+    if trend is None or math.isnan(trend):
         return 0.7
     if trend < -2:
         return 1.0
@@ -245,10 +327,10 @@ def _score_precip(amount: float) -> float:
         return 0.5
     return 0.2
 
-def _score_twilight(hour: int, sunrise, sunset) -> float:
-    if not sunrise or not sunset:
+def _score_twilight(hour: int, sunrise: int | None, sunset: int | None) -> float:
+    if sunrise is None or sunset is None:
         return 0.7
-    if abs(hour - sunrise.hour) <= 1 or abs(hour - sunset.hour) <= 1:
+    if abs(hour - sunrise // 60) <= 1 or abs(hour - sunset // 60) <= 1:
         return 1.0
     return 0.7
 
@@ -261,20 +343,138 @@ def _score_moon_phase(phase: float) -> float:
     return 0.7
 
 def _score_solunar(hour: int, transit, underfoot, moonrise, moonset) -> float:
+    # Events are minutes since local midnight, None when absent
     boost = 0
     for event in [transit, underfoot]:
-        if event and abs(hour - event.hour) <= 1:
+        if event is not None and abs(hour - event // 60) <= 1:
             boost += 0.5
     for event in [moonrise, moonset]:
-        if event and abs(hour - event.hour) <= 1:
+        if event is not None and abs(hour - event // 60) <= 1:
             boost += 0.25
     return min(1.0, 0.6 + boost)
 
 
-def _parse_time(time_str: str):
-    if not time_str:
-        return None
-    try:
-        return datetime.datetime.strptime(time_str, "%H:%M").time()
-    except Exception:
-        return None
+# ----------------------------
+# Vectorized scoring
+# ----------------------------
+
+# Summation order matches _score_hour so both paths give identical floats.
+def score_table(
+    hourly: HourlyArrays,
+    astro_data: LocalAstronomy,
+    table: ProfileTable,
+    rows: np.ndarray,
+    weights: np.ndarray,
+) -> np.ndarray:
+    """Score the table rows `rows` with a COMPONENTS-ordered weight vector; (species, hours)."""
+    shared = score_components(hourly, astro_data)
+
+    components = dict(shared)
+    components["temp"] = _score_temp_array(
+        hourly["temp"], table.temp_low[rows][:, None], table.temp_high[rows][:, None]
+    )
+    components["cloud"] = 1 - np.abs(hourly["cloud"] - table.ideal_cloud[rows][:, None]) / 100
+
+    total = components["temp"] * weights[0]
+    for i, name in enumerate(COMPONENTS[1:], start=1):
+        total = total + components[name] * weights[i]
+    return _round2(np.broadcast_to(total, (len(rows), len(hourly["hour"]))))
+
+
+def score_components(hourly: HourlyArrays, astro_data: LocalAstronomy) -> Dict[str, np.ndarray]:
+    """Compute the species-independent component scores over the whole horizon."""
+    days, day_index = _day_index(hourly)
+    hour = hourly["hour"].astype(float)
+
+    day_events, day_moon_phase = astro_data.for_days(days)
+    events = {key: _event_hours(minutes)[day_index] for key, minutes in day_events.items()}
+    moon_phase = day_moon_phase[day_index]
+
+    return {
+        "pressure": _score_pressure_trend_array(hourly["pressure_trend"]),
+        "wind": _score_wind_array(hourly["wind"]),
+        "precip": _score_precip_array(hourly["precip"]),
+        "twilight": _score_twilight_array(hour, events["sunrise"], events["sunset"]),
+        "solunar": _score_solunar_array(
+            hour, events["moon_transit"], events["moon_underfoot"], events["moonrise"], events["moonset"]
+        ),
+        "moon": _score_moon_phase_array(moon_phase),
+    }
+
+
+def _round2(x: np.ndarray) -> np.ndarray:
+    """Round to 2 decimals exactly like Python's round(x, 2).
+
+    np.round scales by 100 first, so values such as 0.715 (stored just below)
+    can round the other way. Recover the exact product x * 100 = p + err
+    (Dekker split) and round that instead.
+    """
+    p = x * 100
+    split = 134217729.0 * x
+    hi = split - (split - x)
+    lo = x - hi
+    err = (hi * 100 - p) + lo * 100
+    k = np.floor(p)
+    over_half = (p - (k + 0.5)) + err
+    tie_up = (over_half == 0) & (k % 2 == 1)
+    return (k + ((over_half > 0) | tie_up)) / 100
+
+
+def _sample_minutes(hourly: HourlyArrays) -> int:
+    """Spacing of the time axis in minutes (60 for Open-Meteo hourly data)."""
+    if len(hourly["datetime"]) < 2:
+        return 60
+    return max(1, int(np.median(np.diff(hourly["datetime"]).astype(np.int64))))
+
+
+def _day_index(hourly: HourlyArrays) -> tuple[list[str], np.ndarray]:
+    dates = hourly["datetime"].astype("datetime64[D]")
+    days, day_index = np.unique(dates, return_inverse=True)
+    return [str(d) for d in days], day_index
+
+
+def _event_hours(minutes: np.ndarray) -> np.ndarray:
+    # Local hour of each day's event, NaN where there is none
+    return np.where(minutes == NO_EVENT, np.nan, minutes // 60)
+
+
+def _near(hour: np.ndarray, event_hour: np.ndarray) -> np.ndarray:
+    # NaN (missing event) compares False
+    return np.abs(hour - event_hour) <= 1
+
+
+def _score_temp_array(temp: np.ndarray, low: np.ndarray, high: np.ndarray) -> np.ndarray:
+    below = np.maximum(0, (temp - (low - 10)) / 10)
+    above = np.maximum(0, (high + 10 - temp) / 10)
+    return np.where(temp < low, below, np.where(temp > high, above, 1.0))
+
+
+def _score_pressure_trend_array(trend: np.ndarray) -> np.ndarray:
+    return np.select([trend < -2, trend > 2], [1.0, 0.4], 0.7)
+
+
+def _score_wind_array(speed: np.ndarray) -> np.ndarray:
+    return np.select([speed < 2, speed < 6, speed < 10], [0.8, 1.0, 0.6], 0.2)
+
+
+def _score_precip_array(amount: np.ndarray) -> np.ndarray:
+    return np.select([amount == 0, amount < 1, amount < 5], [0.7, 1.0, 0.5], 0.2)
+
+
+def _score_twilight_array(hour: np.ndarray, sunrise: np.ndarray, sunset: np.ndarray) -> np.ndarray:
+    known = ~np.isnan(sunrise) & ~np.isnan(sunset)
+    return np.where(known & (_near(hour, sunrise) | _near(hour, sunset)), 1.0, 0.7)
+
+
+def _score_moon_phase_array(phase: np.ndarray) -> np.ndarray:
+    return np.where((phase < 0.1) | (phase > 0.9), 1.0, 0.7)
+
+
+def _score_solunar_array(hour, transit, underfoot, moonrise, moonset) -> np.ndarray:
+    boost = (
+        _near(hour, transit) * 0.5
+        + _near(hour, underfoot) * 0.5
+        + _near(hour, moonrise) * 0.25
+        + _near(hour, moonset) * 0.25
+    )
+    return np.minimum(1.0, 0.6 + boost)
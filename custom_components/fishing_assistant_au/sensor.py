@@ -3,11 +3,14 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import DOMAIN
+from .instrumentation import STATS
+from .ratelimit import DATA_SCHEDULER, RequestScheduler
 import datetime
 
-from .score import get_fish_score_forecast, scale_score
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -15,6 +18,7 @@ async def async_setup_entry(
 ):
     """Set up fishing assistant sensors from a config entry."""
     data = config_entry.data
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
     sensors = []
 
     name = data["name"]
@@ -28,6 +32,7 @@ async def async_setup_entry(
     for fish in fish_list:
         sensors.append(
             FishScoreSensor(
+                coordinator=coordinator,
                 name=name,
                 fish=fish,
                 lat=lat,
@@ -39,15 +44,33 @@ async def async_setup_entry(
             )
         )
 
+    sensors.append(
+        FishingAssistantPerformanceSensor(
+            coordinator=coordinator,
+            name=name,
+            lat=lat,
+            lon=lon,
+            config_entry_id=config_entry.entry_id,
+        )
+    )
+
     async_add_entities(sensors)
 
 
-class FishScoreSensor(SensorEntity):
-    should_poll = True
-    
-    def __init__(self, name, fish, lat, lon, body_type, timezone, elevation, config_entry_id):
-        self._last_update_hour = None
+class FishScoreSensor(CoordinatorEntity, SensorEntity):
+    """Today's score for one species, with the full forecast as an attribute.
+
+    The forecast and fetch time are available from the state machine but not
+    stored by the recorder, and the state is only written when the score,
+    forecast, best windows or staleness changed.
+    """
+
+    _unrecorded_attributes = frozenset({"forecast", "fetched_at"})
+
+    def __init__(self, coordinator, name, fish, lat, lon, body_type, timezone, elevation, config_entry_id):
+        super().__init__(coordinator)
         self._config_entry_id = config_entry_id
+        self._written = None
         self._device_identifier = f"{name}_{lat}_{lon}"
         self._name = f"{name.lower().replace(' ', '_')}_{fish}_score"
         self._friendly_name = f"{name} ({fish.title()}) Fishing Score"
@@ -101,33 +124,99 @@ class FishScoreSensor(SensorEntity):
             "via_device": None            
         }
 
-    async def async_update(self):
-        """Fetch the 7-day forecast and set today's score as state."""
-        now = datetime.datetime.now()
-        update_hours = [0, 6, 12, 18]
-    
-        if self._last_update_hour is not None and now.hour not in update_hours:
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick this species' forecast out of the shared location data."""
+        self._update_from_coordinator()
+        written = self._write_key()
+        if written == self._written:
             return
+        self._written = written
+        super()._handle_coordinator_update()
+
+    def _write_key(self) -> tuple:
+        """What a refresh must change to be written; a new fetched_at alone is not enough."""
+        return (
+            self.available,
+            self._state,
+            self._attrs.get("forecast"),
+            self._attrs.get("best_windows"),
+            self._attrs.get("stale"),
+        )
 
-        if self._last_update_hour == now.hour:
+    def _update_from_coordinator(self) -> None:
+        data = self.coordinator.data
+        if not data:
             return
 
-        forecast = await get_fish_score_forecast(
-            hass=self.hass,
-            fish=self._attrs["fish"],
-            lat=self._attrs["lat"],
-            lon=self._attrs["lon"],
-            timezone=self._attrs["timezone"],
-            elevation=self._attrs["elevation"],
-            body_type=self._attrs["body_type"],
-        )
+        forecast = data["forecasts"].get(self._attrs["fish"], {})
 
         today_str = datetime.date.today().strftime("%Y-%m-%d")
         today_data = forecast.get(today_str, {})
         self._state = today_data.get("score", 0)
 
         self._attrs["forecast"] = forecast
-        self._last_update_hour = now.hour
+        self._attrs["best_windows"] = data.get("top_windows", {}).get(self._attrs["fish"], [])
+        # A stale forecast is the last good one, kept while upstream is retried
+        self._attrs["stale"] = data.get("stale", False)
+        self._attrs["fetched_at"] = data.get("fetched_at")
 
     async def async_added_to_hass(self):
-        await self.async_update()
\ No newline at end of file
+        await super().async_added_to_hass()
+        self._update_from_coordinator()
+        # The platform writes the first state right after this
+        self._written = self._write_key()
+
+
+class FishingAssistantPerformanceSensor(CoordinatorEntity, SensorEntity):
+    """Last refresh duration, with rolling per-stage timings as attributes.
+
+    Disabled by default; while enabled it keeps the shared timers collecting.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = "ms"
+    _attr_icon = "mdi:timer-outline"
+    _unrecorded_attributes = frozenset({"stages", "counters", "upstream"})
+
+    def __init__(self, coordinator, name, lat, lon, config_entry_id):
+        super().__init__(coordinator)
+        self._config_entry_id = config_entry_id
+        self._device_identifier = f"{name}_{lat}_{lon}"
+        self._location = name
+        self._attr_name = f"{name} Refresh Time"
+        self._attr_unique_id = f"{name.lower().replace(' ', '_')}_refresh_time"
+
+    @property
+    def native_value(self):
+        duration = self.coordinator.last_refresh_duration
+        return None if duration is None else round(duration * 1000, 1)
+
+    @property
+    def extra_state_attributes(self):
+        summary = STATS.summary()
+        attrs = {"stages": summary["stages"], "counters": summary["counters"]}
+        scheduler = self.hass.data.get(DATA_SCHEDULER)
+        if isinstance(scheduler, RequestScheduler):
+            attrs["upstream"] = scheduler.snapshot()
+        return attrs
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, self._device_identifier)},
+            "name": self._location,
+            "manufacturer": "Fishing Assistant",
+            "model": "Fish Score Sensor",
+            "entry_type": "service",
+            "via_device": None
+        }
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        STATS.enable(self.entity_id)
+
+    async def async_will_remove_from_hass(self):
+        STATS.disable(self.entity_id)
+        await super().async_will_remove_from_hass()
@@ -0,0 +1,148 @@
+"""Ad-hoc forecasts for any location, returned as service response data."""
+import asyncio
+import logging
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    DEFAULT_TOP_K,
+    DEFAULT_WINDOW_HOURS,
+    DOMAIN,
+    MAX_SERVICE_LOCATIONS,
+    MAX_TOP_K,
+    MAX_WINDOW_HOURS,
+    SERVICE_GET_FORECAST,
+)
+from .executor import async_run_compute
+from .helpers.location import async_resolve_location_metadata
+from .profile_table import BODY_TYPES, async_get_profile_table
+from .ratelimit import PRIORITY_URGENT
+from .score import build_location_forecast, get_location_forecast_data
+
+_LOGGER = logging.getLogger(__name__)
+
+LOCATION_SCHEMA = vol.Schema(
+    {
+        vol.Required("latitude"): cv.latitude,
+        vol.Required("longitude"): cv.longitude,
+        vol.Optional("name"): cv.string,
+    }
+)
+
+GET_FORECAST_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Inclusive("latitude", "coordinates"): cv.latitude,
+            vol.Inclusive("longitude", "coordinates"): cv.longitude,
+            vol.Optional("locations"): vol.All(
+                cv.ensure_list, [LOCATION_SCHEMA], vol.Length(min=1, max=MAX_SERVICE_LOCATIONS)
+            ),
+            vol.Optional("species"): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional("body_type", default="lake"): vol.In(BODY_TYPES),
+            vol.Optional("window_hours", default=DEFAULT_WINDOW_HOURS): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=MAX_WINDOW_HOURS)
+            ),
+            vol.Optional("top_k", default=DEFAULT_TOP_K): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=MAX_TOP_K)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key("latitude", "locations"),
+)
+
+# Identical location requests in progress, so concurrent calls share the work
+_in_flight: dict[tuple, asyncio.Task] = {}
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def _get_forecast(call: ServiceCall) -> ServiceResponse:
+        return await async_get_forecast(hass, call.data)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_FORECAST,
+        _get_forecast,
+        schema=GET_FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+async def async_get_forecast(hass: HomeAssistant, data: dict) -> ServiceResponse:
+    """Score every requested location concurrently.
+
+    Locations resolve their timezone and elevation through the same caches as
+    new config entries, and their weather and astronomy through the same grid
+    cells, caches and batched Open-Meteo calls as the sensors.
+    """
+    table = await async_get_profile_table(hass)
+    species = data.get("species") or list(table.names)
+    unknown = [fish for fish in species if fish not in table]
+    if unknown:
+        raise ServiceValidationError(f"No fish profile found for {', '.join(unknown)}")
+
+    locations = list(data.get("locations", []))
+    if "latitude" in data:
+        locations.insert(0, {"latitude": data["latitude"], "longitude": data["longitude"]})
+
+    options = (tuple(species), data["body_type"], data["window_hours"], data["top_k"])
+    results = await asyncio.gather(
+        *(_async_location(hass, location["latitude"], location["longitude"], options) for location in locations)
+    )
+    for location, result in zip(locations, results):
+        if "name" in location:
+            result["name"] = location["name"]
+    return {"locations": results}
+
+
+async def _async_location(hass: HomeAssistant, lat: float, lon: float, options: tuple) -> dict:
+    key = (lat, lon, *options)
+    request = _in_flight.get(key)
+    if request is None:
+        request = _in_flight[key] = hass.async_create_task(_async_score_location(hass, lat, lon, options))
+
+        def _forget(done: asyncio.Task) -> None:
+            if _in_flight.get(key) is done:
+                del _in_flight[key]
+
+        request.add_done_callback(_forget)
+    else:
+        _LOGGER.debug("Joining in-flight forecast request for %s, %s", lat, lon)
+
+    # Callers add their own keys, so each gets a copy
+    return dict(await asyncio.shield(request))
+
+
+async def _async_score_location(hass: HomeAssistant, lat: float, lon: float, options: tuple) -> dict:
+    species, body_type, window_hours, top_k = options
+    metadata = await async_resolve_location_metadata(hass, lat, lon)
+    result = {"latitude": lat, "longitude": lon, **metadata}
+
+    # Someone is waiting on the response
+    data = await get_location_forecast_data(
+        hass, lat, lon, metadata["timezone"], metadata["elevation"], priority=PRIORITY_URGENT
+    )
+    if not data:
+        result["error"] = "No forecast data available"
+        return result
+
+    scored = await async_run_compute(
+        hass,
+        build_location_forecast,
+        data["weather"],
+        data["astro"],
+        body_type,
+        list(species),
+        window_hours,
+        top_k,
+        await async_get_profile_table(hass),
+    )
+    result["stale"] = data["stale"]
+    result["fetched_at"] = data["fetched_at"].isoformat()
+    result["forecasts"] = scored["forecasts"]
+    result["best_windows"] = scored["top_windows"]
+    return result
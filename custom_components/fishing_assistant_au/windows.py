@@ -0,0 +1,55 @@
+"""Linear-time best-window search over a continuous multi-day score series."""
+import numpy as np
+
+
+def window_sums(series: np.ndarray, length: int) -> np.ndarray:
+    """Sum of every `length`-sample window along the last axis, from prefix sums.
+
+    Column i is the window starting at sample i, so a (species, samples) input
+    gives (species, samples - length + 1). Integer input stays exact.
+    """
+    prefix = np.zeros(series.shape[:-1] + (series.shape[-1] + 1,), dtype=series.dtype)
+    np.cumsum(series, axis=-1, out=prefix[..., 1:])
+    return prefix[..., length:] - prefix[..., :-length]
+
+
+def top_k_windows(
+    sums: np.ndarray,
+    length: int,
+    k: int,
+    groups: np.ndarray | None = None,
+    n_groups: int = 1,
+) -> np.ndarray:
+    """Start indices of the k best non-overlapping windows per series and group.
+
+    `groups` assigns each window start to a contiguous, ascending group (a day),
+    so a window belongs to the day it starts in and may run past midnight. With
+    no groups the whole horizon is one group. Windows with a non-positive sum are
+    never picked; ties go to the earliest start. Missing picks are -1.
+
+    Each pick is one argmax and one mask over the padded (series, group, start)
+    array, so the search is O(k * n) for n window starts.
+    """
+    n_series, n_windows = sums.shape
+    picks = np.full((n_series, n_groups, k), -1, dtype=np.intp)
+    if n_windows == 0 or k == 0:
+        return picks
+    if groups is None:
+        groups = np.zeros(n_windows, dtype=np.intp)
+
+    first = np.searchsorted(groups, np.arange(n_groups))
+    offset = np.arange(n_windows) - first[groups]
+    width = int(offset.max()) + 1
+
+    ranked = np.full((n_series, n_groups, width), -np.inf)
+    ranked[:, groups, offset] = sums
+    ranked[ranked <= 0] = -np.inf
+
+    columns = np.arange(width)
+    for i in range(k):
+        best = ranked.argmax(axis=2)
+        found = np.take_along_axis(ranked, best[..., None], axis=2)[..., 0] > -np.inf
+        picks[..., i] = np.where(found, first + best, -1)
+        # Block every start whose window would overlap the one just taken
+        ranked[np.abs(columns - best[..., None]) < length] = -np.inf
+    return picks
@@ -0,0 +1,38 @@
+"""Shared fixtures; the tests import the integration from the repository root."""
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(REPO_ROOT, "benchmarks", "fixtures")
+sys.path.insert(0, REPO_ROOT)
+
+
+@pytest.fixture
+def open_meteo_forecast() -> dict:
+    """The benchmark's 7-day Sydney forecast (2025-01-15..21) in the Open-Meteo layout."""
+    with open(os.path.join(FIXTURE_DIR, "open_meteo_forecast.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def run_with_hass(tmp_path):
+    """Run `test(hass)` in a fresh event loop with a minimal HomeAssistant on tmp_path."""
+    from homeassistant import config_entries
+    from homeassistant.core import HomeAssistant
+
+    def run(test):
+        async def main():
+            hass = HomeAssistant(str(tmp_path))
+            hass.config_entries = config_entries.ConfigEntries(hass, {})
+            try:
+                return await test(hass)
+            finally:
+                await hass.async_stop(force=True)
+
+        return asyncio.run(main())
+
+    return run
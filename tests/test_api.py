@@ -0,0 +1,81 @@
+"""Batched Open-Meteo calls: every caller gets an answer when a call fails."""
+import asyncio
+import datetime
+
+import pytest
+
+from custom_components.fishing_assistant_au import api
+
+START = datetime.date(2025, 1, 15)
+END = datetime.date(2025, 1, 21)
+
+
+class _Scheduler:
+    async def async_acquire(self, cost: int, priority: int) -> bool:
+        return True
+
+
+def _raise(error):
+    async def fail(*args, **kwargs):
+        raise error
+
+    return fail
+
+
+async def _always_allowed(hass):
+    return _Scheduler()
+
+
+@pytest.fixture(autouse=True)
+def _no_batch_window(monkeypatch):
+    monkeypatch.setattr(api, "BATCH_WINDOW", 0)
+
+
+@pytest.mark.parametrize(
+    "scheduler, fetch",
+    [
+        (_raise(OSError("storage unreadable")), None),
+        (_always_allowed, _raise(ValueError("bad response"))),
+        (_always_allowed, _raise(asyncio.CancelledError())),
+    ],
+    ids=["scheduler_load_fails", "fetch_raises", "fetch_cancelled"],
+)
+def test_failed_call_resolves_every_caller(run_with_hass, monkeypatch, scheduler, fetch):
+    monkeypatch.setattr(api, "async_get_request_scheduler", scheduler)
+    if fetch is not None:
+        monkeypatch.setattr(api, "_fetch_forecast_data", fetch)
+
+    async def test(hass):
+        calls = [
+            api.get_forecast_data(hass, -33.87, 151.21, "Australia/Sydney", 20, START, END),
+            api.get_forecast_data(hass, -33.87, 151.21, "Australia/Sydney", 20, START, END),
+            api.get_forecast_data(hass, -33.85, 151.25, "Australia/Sydney", 0, START, END),
+        ]
+        results = await asyncio.wait_for(asyncio.gather(*calls), timeout=5)
+        return results, dict(api._in_flight)
+
+    results, in_flight = run_with_hass(test)
+    assert results == [{}, {}, {}]
+    assert in_flight == {}
+
+
+def test_successful_call_is_shared(run_with_hass, monkeypatch):
+    monkeypatch.setattr(api, "async_get_request_scheduler", _always_allowed)
+    calls = []
+
+    async def fetch(hass, lats, lons, elevations, timezone, start_date, end_date):
+        calls.append(list(zip(lats, lons)))
+        return [{"hourly": {}, "daily": {}, "latitude": lat} for lat in lats]
+
+    monkeypatch.setattr(api, "_fetch_forecast_data", fetch)
+
+    async def test(hass):
+        return await asyncio.gather(
+            api.get_forecast_data(hass, -33.87, 151.21, "Australia/Sydney", 20, START, END),
+            api.get_forecast_data(hass, -33.87, 151.21, "Australia/Sydney", 20, START, END),
+            api.get_forecast_data(hass, -33.85, 151.25, "Australia/Sydney", 0, START, END),
+        )
+
+    results = run_with_hass(test)
+    assert [r["latitude"] for r in results] == [-33.87, -33.87, -33.85]
+    assert calls == [[(-33.87, 151.21), (-33.85, 151.25)]]
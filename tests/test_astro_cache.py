@@ -0,0 +1,54 @@
+"""Astronomy cache storage migration and eviction."""
+import asyncio
+import json
+import os
+
+from custom_components.fishing_assistant_au.const import ASTRO_CACHE_MAX_CELLS, ASTRO_CACHE_STORAGE_KEY
+from custom_components.fishing_assistant_au.helpers.astro_cache import AstronomyCache
+
+
+def test_version_1_cache_is_migrated(run_with_hass, tmp_path):
+    os.makedirs(tmp_path / ".storage")
+    with open(tmp_path / ".storage" / ASTRO_CACHE_STORAGE_KEY, "w", encoding="utf-8") as f:
+        json.dump({
+            "version": 1,
+            "key": ASTRO_CACHE_STORAGE_KEY,
+            "data": {"cells": {"-33.8700,151.2100": {"days": {
+                "2999-01-01": {"sunrise": "19:02", "sunset": None, "moon_phase": 0.4},
+                "2999-01-02": {"sunrise": 1143, "sunset": 548},
+            }}}},
+        }, f)
+
+    async def test(hass):
+        cache = AstronomyCache(hass)
+        await cache.async_load()
+        return cache._cells["-33.8700,151.2100"]["days"]
+
+    assert run_with_hass(test) == {
+        "2999-01-01": {"sunrise": 19 * 60 + 2, "sunset": None},
+        "2999-01-02": {"sunrise": 1143, "sunset": 548},
+    }
+
+
+def test_evicted_cells_drop_their_locks(run_with_hass):
+    async def test(hass):
+        cache = AstronomyCache(hass)
+        for i in range(ASTRO_CACHE_MAX_CELLS + 2):
+            key = f"cell{i}"
+            cache._cells[key] = {"days": {}, "last_used": f"{i:04d}"}
+            cache._locks[key] = asyncio.Lock()
+        held = cache._locks["cell1"]
+        await held.acquire()
+        cache._evict()
+        return cache, held
+
+    cache, held = run_with_hass(test)
+    assert len(cache._cells) == ASTRO_CACHE_MAX_CELLS
+    assert "cell0" not in cache._cells and "cell0" not in cache._locks
+    # Still held by a computation, so it stays until the next eviction
+    assert cache._locks["cell1"] is held
+    assert "cell2" in cache._locks
+
+    held.release()
+    cache._evict()
+    assert set(cache._locks) == set(cache._cells)
@@ -0,0 +1,74 @@
+"""The backtest engine against the live per-day scoring, on synthetic npz chunks."""
+import datetime
+import json
+import os
+
+import numpy as np
+import pytest
+
+from custom_components.fishing_assistant_au import score
+from custom_components.fishing_assistant_au.backtest import run_backtest
+from custom_components.fishing_assistant_au.helpers import astro, moon
+from custom_components.fishing_assistant_au.profile_table import build_profile_table
+
+EPHEMERIS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmarks", "fixtures", "de421_2025q1.bsp")
+START = datetime.date(2025, 1, 15)
+LOCATION = {"id": "sydney", "lat": -33.875, "lon": 151.25, "body_type": "lake", "timezone": "Australia/Sydney"}
+# A user table: one built-in species overridden, one added
+TABLE = build_profile_table({
+    "carp": {"temp_range": (15.0, 21.0), "ideal_cloud": 30.0, "prefers_low_pressure": False},
+    "yabby": {"temp_range": (20.0, 26.0), "ideal_cloud": 60.0, "prefers_low_pressure": True},
+})
+SPECIES = ["carp", "trout", "yabby"]
+
+
+def _write_archive(path, forecast: dict, splits: list[int]) -> None:
+    columns = {name: np.asarray(values) for name, values in forecast["hourly"].items()}
+    columns["time"] = columns["time"].astype("datetime64[m]")
+    os.makedirs(path / LOCATION["id"])
+    bounds = [0, *splits, len(columns["time"])]
+    for i, (a, b) in enumerate(zip(bounds, bounds[1:])):
+        np.savez(path / LOCATION["id"] / f"{i:02d}.npz", **{name: values[a:b] for name, values in columns.items()})
+    (path / "locations.json").write_text(json.dumps([LOCATION]))
+
+
+def _live_forecasts(forecast: dict) -> dict:
+    """Per-day scores as the integration computes them for the same weather and place."""
+    context = astro._load_astronomy_context(EPHEMERIS)
+    utc_start = START - datetime.timedelta(days=1)
+    events = astro.compute_astronomy_forecast(context, LOCATION["lat"], LOCATION["lon"], 10, utc_start)
+    moon_days = moon.compute_moon_days(context, utc_start, 10)
+    context.close()
+    astro_data = astro.localize_astronomy(
+        {d: {**day, **moon_days[d]} for d, day in events.items()}, LOCATION["timezone"], START, 8
+    )
+    forecasts, _ = score.score_species_windows(
+        score.build_hourly_arrays(forecast), astro_data, "lake", SPECIES, 3, 1, TABLE
+    )
+    return forecasts
+
+
+# Midnight splits: whole days per chunk, as the archive layout requires
+@pytest.mark.parametrize("splits", [[], [48, 96]], ids=["one_chunk", "three_chunks"])
+def test_backtest_matches_live_scoring(tmp_path, open_meteo_forecast, splits):
+    _write_archive(tmp_path, open_meteo_forecast, splits)
+    result = run_backtest(
+        str(tmp_path), str(tmp_path / "out"), SPECIES, 3, workers=1, ephemeris=EPHEMERIS, table=TABLE
+    )["sydney"]
+
+    live = _live_forecasts(open_meteo_forecast)
+    days = sorted(live["carp"])
+    assert [str(d) for d in result["dates"]] == days
+    assert list(result["species"]) == SPECIES
+    for s, fish in enumerate(SPECIES):
+        assert result["scores"][s].tolist() == [live[fish][d]["score"] for d in days]
+        starts = [live[fish][d]["windows"][0]["start"] if live[fish][d]["windows"] else "NaT" for d in days]
+        assert [str(start) for start in result["best_start"][s]] == starts
+
+    with np.load(tmp_path / "out" / "sydney.npz") as saved:
+        np.testing.assert_array_equal(saved["scores"], result["scores"])
+
+
+def test_species_missing_from_the_table_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="yabby"):
+        run_backtest(str(tmp_path), species=["carp", "yabby"])
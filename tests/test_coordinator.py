@@ -0,0 +1,160 @@
+"""Refresh timing, stale revalidation backoff and the forecast build cap."""
+import asyncio
+import datetime
+
+from homeassistant.config_entries import ConfigEntry
+
+from custom_components.fishing_assistant_au import coordinator as coordinator_module
+from custom_components.fishing_assistant_au.const import DOMAIN
+from custom_components.fishing_assistant_au.coordinator import (
+    MAX_CONCURRENT_BUILDS,
+    REFRESH_HOURS_UTC,
+    REFRESH_JITTER,
+    STALE_REFRESH_DELAY,
+    STALE_REFRESH_MAX_DELAY,
+    FishingAssistantCoordinator,
+    next_refresh_time,
+    refresh_offset,
+    revalidate_delay,
+)
+
+UTC = datetime.timezone.utc
+DAY = datetime.datetime(2025, 1, 15, tzinfo=UTC)
+
+
+def test_refresh_offset_is_stable_and_within_the_jitter():
+    offsets = [refresh_offset(f"entry{i}") for i in range(50)]
+    assert offsets == [refresh_offset(f"entry{i}") for i in range(50)]
+    assert all(datetime.timedelta(0) <= offset < REFRESH_JITTER for offset in offsets)
+    assert len(set(offsets)) > 1
+
+
+def test_next_refresh_follows_the_model_run_hours():
+    offset = datetime.timedelta(minutes=3, seconds=20)
+    slots = [DAY + datetime.timedelta(hours=hour) + offset for hour in REFRESH_HOURS_UTC]
+    slots.append(slots[0] + datetime.timedelta(days=1))
+    for slot, following in zip(slots, slots[1:]):
+        # Just before a slot gives that slot; the slot itself gives the next one
+        assert next_refresh_time(slot - datetime.timedelta(seconds=1), offset) == slot
+        assert next_refresh_time(slot, offset) == following
+
+
+def test_next_refresh_accepts_local_times():
+    offset = datetime.timedelta(minutes=5)
+    sydney = datetime.timezone(datetime.timedelta(hours=11))
+    after = DAY.astimezone(sydney)
+    assert next_refresh_time(after, offset) == next_refresh_time(DAY, offset)
+
+
+def test_revalidate_delay_doubles_up_to_the_cap(monkeypatch):
+    expected = [min(STALE_REFRESH_MAX_DELAY, STALE_REFRESH_DELAY * 2 ** attempt) for attempt in range(12)]
+    assert expected[-1] == STALE_REFRESH_MAX_DELAY
+    # Jittered over the upper half of each delay
+    monkeypatch.setattr(coordinator_module.random, "uniform", lambda low, high: high)
+    assert [revalidate_delay(attempt) for attempt in range(12)] == expected
+    monkeypatch.setattr(coordinator_module.random, "uniform", lambda low, high: low)
+    assert [revalidate_delay(attempt) for attempt in range(12)] == [delay / 2 for delay in expected]
+
+
+def _coordinator(hass, name: str = "Spot") -> FishingAssistantCoordinator:
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=name,
+        data={
+            "name": name,
+            "latitude": -33.8,
+            "longitude": 151.2,
+            "timezone": "Australia/Sydney",
+            "elevation": 20,
+            "fish": ["bream"],
+            "body_type": "lake",
+        },
+        source="user",
+    )
+    return FishingAssistantCoordinator(hass, entry)
+
+
+def _location_data(stale: bool) -> dict:
+    return {"weather": {}, "astro": None, "stale": stale, "fetched_at": DAY}
+
+
+async def _build(hass, func, *args):
+    return {}
+
+
+async def _table(hass):
+    return None
+
+
+def test_stale_forecast_is_revalidated_with_capped_backoff(run_with_hass, monkeypatch):
+    stale = True
+    scheduled = []
+
+    async def fake_data(hass, **kwargs):
+        return _location_data(stale)
+
+    def fake_call_later(hass, delay, action):
+        scheduled.append((delay, action))
+        return lambda: None
+
+    monkeypatch.setattr(coordinator_module, "get_location_forecast_data", fake_data)
+    monkeypatch.setattr(coordinator_module, "async_run_compute", _build)
+    monkeypatch.setattr(coordinator_module, "async_get_profile_table", _table)
+    monkeypatch.setattr(coordinator_module, "async_call_later", fake_call_later)
+    monkeypatch.setattr(coordinator_module.random, "uniform", lambda low, high: high)
+
+    async def test(hass):
+        nonlocal stale
+        coordinator = _coordinator(hass)
+        await coordinator.async_refresh()
+        # A scheduled refresh while a retry is pending does not add another
+        await coordinator.async_refresh()
+        assert len(scheduled) == 1
+        for _ in range(9):
+            await scheduled[-1][1](None)
+        stale = False
+        await scheduled[-1][1](None)
+        return coordinator.revalidate_attempt, coordinator.data["stale"]
+
+    assert run_with_hass(test) == (0, False)
+    assert [delay for delay, _ in scheduled] == [
+        min(STALE_REFRESH_MAX_DELAY, STALE_REFRESH_DELAY * 2 ** attempt) for attempt in range(10)
+    ]
+
+
+def test_only_the_build_stage_is_capped(run_with_hass, monkeypatch):
+    entries = MAX_CONCURRENT_BUILDS + 2
+    waiting = 0
+    building = peak = 0
+
+    async def test(hass):
+        all_waiting = asyncio.Event()
+
+        async def fake_data(hass, **kwargs):
+            nonlocal waiting
+            waiting += 1
+            if waiting == entries:
+                all_waiting.set()
+            # Every entry must reach upstream together for the batcher to merge them
+            await asyncio.wait_for(all_waiting.wait(), 1)
+            return _location_data(False)
+
+        async def fake_build(hass, func, *args):
+            nonlocal building, peak
+            building += 1
+            peak = max(peak, building)
+            await asyncio.sleep(0.01)
+            building -= 1
+            return {}
+
+        monkeypatch.setattr(coordinator_module, "get_location_forecast_data", fake_data)
+        monkeypatch.setattr(coordinator_module, "async_run_compute", fake_build)
+        monkeypatch.setattr(coordinator_module, "async_get_profile_table", _table)
+        coordinators = [_coordinator(hass, f"Spot {i}") for i in range(entries)]
+        return await asyncio.gather(*(c._async_update_data() for c in coordinators))
+
+    results = run_with_hass(test)
+    assert len(results) == entries
+    assert peak == MAX_CONCURRENT_BUILDS
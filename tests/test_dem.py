@@ -0,0 +1,89 @@
+"""Elevation lookups on small synthetic tiles."""
+import numpy as np
+import pytest
+
+from custom_components.fishing_assistant_au.helpers.dem import VOID, DemElevationProvider, tile_name
+
+# S34E151 covers lat -34..-33 and lon 151..152; row 0 is the north edge
+TILE = np.array([[0, 10, 20], [30, 40, 50], [60, 70, 80]], dtype=np.int16)
+
+
+def _write_tile(directory, tile: np.ndarray, fmt: str, name: str = "S34E151") -> None:
+    if fmt == "hgt":
+        tile.astype(">i2").tofile(directory / f"{name}.hgt")
+    else:
+        np.save(directory / f"{name}.npy", tile)
+
+
+@pytest.fixture(params=["hgt", "npy"])
+def fmt(request):
+    return request.param
+
+
+def test_tile_name():
+    assert tile_name(-33.8, 151.2) == "S34E151"
+    assert tile_name(0.5, -0.5) == "N00W001"
+
+
+@pytest.mark.parametrize(
+    "lat, lon, expected",
+    [
+        (-33.000001, 151.000001, 0),  # next to the north-west corner sample
+        (-33.25, 151.25, 20),  # centre of the first cell: mean of 0, 10, 30, 40
+        (-33.5, 151.75, 45),  # halfway between 40 and 50
+        (-33.1, 151.3, 0.8 * 0.4 * 0 + 0.8 * 0.6 * 10 + 0.2 * 0.4 * 30 + 0.2 * 0.6 * 40),
+    ],
+)
+def test_bilinear_interpolation(tmp_path, fmt, lat, lon, expected):
+    _write_tile(tmp_path, TILE, fmt)
+    assert DemElevationProvider(str(tmp_path)).elevation_at(lat, lon) == pytest.approx(expected, abs=1e-3)
+
+
+@pytest.mark.parametrize(
+    "lat, lon, expected",
+    [
+        (-34.0, 151.5, 70),  # south edge, in this tile
+        (-34.0, 151.0, 60),  # south-west corner
+        (-33.5, 151.999999, 50),  # just inside the east edge
+    ],
+)
+def test_tile_edges(tmp_path, fmt, lat, lon, expected):
+    _write_tile(tmp_path, TILE, fmt)
+    assert DemElevationProvider(str(tmp_path)).elevation_at(lat, lon) == pytest.approx(expected, abs=1e-3)
+
+
+def test_north_edge_is_read_from_the_tile_above(tmp_path, fmt):
+    # Edges are shared, so lat -33 is the south row of S33E151
+    _write_tile(tmp_path, TILE, fmt)
+    _write_tile(tmp_path, TILE + 100, fmt, name="S33E151")
+    assert DemElevationProvider(str(tmp_path)).elevation_at(-33.0, 151.5) == pytest.approx(170)
+
+
+def test_voids_drop_out_of_the_interpolation(tmp_path, fmt):
+    tile = TILE.copy()
+    tile[1, 1] = VOID
+    _write_tile(tmp_path, tile, fmt)
+    provider = DemElevationProvider(str(tmp_path))
+    # The remaining corners of the cell are re-weighted
+    assert provider.elevation_at(-33.25, 151.25) == pytest.approx((0 + 10 + 30) / 3)
+    # A point on the void sample itself falls back to the valid corners
+    assert provider.elevation_at(-33.5, 151.5) == pytest.approx((50 + 70 + 80) / 3)
+
+
+def test_all_void_cell_is_unknown(tmp_path, fmt):
+    tile = TILE.copy()
+    tile[:2, :2] = VOID
+    _write_tile(tmp_path, tile, fmt)
+    assert DemElevationProvider(str(tmp_path)).elevation_at(-33.25, 151.25) is None
+
+
+def test_missing_tile_is_unknown_until_added(tmp_path, fmt):
+    provider = DemElevationProvider(str(tmp_path))
+    assert provider.elevation_at(-33.25, 151.25) is None
+    _write_tile(tmp_path, TILE, fmt)
+    assert provider.elevation_at(-33.25, 151.25) == pytest.approx(20)
+
+
+def test_non_square_hgt_is_ignored(tmp_path):
+    np.zeros(10, dtype=">i2").tofile(tmp_path / "S34E151.hgt")
+    assert DemElevationProvider(str(tmp_path)).elevation_at(-33.25, 151.25) is None
@@ -0,0 +1,45 @@
+"""Compute pool sizing from the config entries' options."""
+import asyncio
+
+from homeassistant.config_entries import ConfigEntry
+
+from custom_components.fishing_assistant_au.const import CONF_COMPUTE_WORKERS, DOMAIN
+from custom_components.fishing_assistant_au.executor import (
+    _get_executor,
+    async_run_compute,
+    shutdown_compute_executor,
+)
+
+
+def _add_entry(hass, workers: int) -> ConfigEntry:
+    entry = ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Spot",
+        data={},
+        source="user",
+        options={CONF_COMPUTE_WORKERS: workers},
+    )
+    hass.config_entries._entries[entry.entry_id] = entry
+    return entry
+
+
+def test_pool_is_resized_after_shutdown(run_with_hass):
+    async def test(hass):
+        entry = _add_entry(hass, 3)
+        _add_entry(hass, 1)
+        first = _get_executor(hass)
+        sizes = [first._max_workers]
+
+        hass.config_entries.async_update_entry(entry, options={CONF_COMPUTE_WORKERS: 5})
+        # A job submitted before the resize still completes
+        pending = hass.async_create_task(async_run_compute(hass, sum, [1, 2]))
+        await asyncio.sleep(0)
+        shutdown_compute_executor(hass)
+        sizes.append(_get_executor(hass)._max_workers)
+        result = await pending
+        shutdown_compute_executor(hass)
+        return sizes, result
+
+    assert run_with_hass(test) == ([3, 5], 3)
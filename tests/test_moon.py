@@ -0,0 +1,36 @@
+"""The process-wide moon table for requests that start in the past."""
+import asyncio
+import datetime
+
+from custom_components.fishing_assistant_au.helpers import moon
+
+
+def test_past_days_are_computed_once_and_returned(run_with_hass, monkeypatch):
+    calls = []
+
+    async def fake_context(hass):
+        return None
+
+    async def fake_compute(hass, func, context, start_date, days):
+        calls.append((start_date, days))
+        # Yield so wait_for can time out if the loop keeps recomputing
+        await asyncio.sleep(0)
+        return {
+            str(start_date + datetime.timedelta(days=i)): {"moon_phase": 0.5}
+            for i in range(days)
+        }
+
+    monkeypatch.setattr(moon, "_moon_days", {})
+    monkeypatch.setattr(moon, "async_get_astronomy_context", fake_context)
+    monkeypatch.setattr(moon, "async_run_compute", fake_compute)
+    start = datetime.date.today() - datetime.timedelta(days=30)
+
+    async def test(hass):
+        first = await asyncio.wait_for(moon.async_get_moon_days(hass, start, 3), 1)
+        second = await asyncio.wait_for(moon.async_get_moon_days(hass, start, 3), 1)
+        return first, second
+
+    first, second = run_with_hass(test)
+    assert list(first) == [str(start + datetime.timedelta(days=i)) for i in range(3)]
+    assert second == first
+    assert calls == [(start, 3)]
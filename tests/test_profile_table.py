@@ -0,0 +1,90 @@
+"""User fish profiles: loading, validation and overriding the built-in species."""
+import json
+import logging
+
+import pytest
+
+from custom_components.fishing_assistant_au.fish_profiles import FISH_PROFILES
+from custom_components.fishing_assistant_au.profile_table import (
+    BUILTIN_PROFILE_TABLE,
+    async_get_profile_table,
+    load_user_profiles,
+)
+
+YAML_PROFILES = """
+yabby:
+  temp_range: [15, "24.5"]
+  ideal_cloud: 40
+bream:
+  temp_range: [16, 22]
+  ideal_cloud: 20
+  prefers_low_pressure: false
+"""
+
+
+def test_yaml_profiles_are_validated_and_coerced(tmp_path):
+    (tmp_path / "fishing_assistant_profiles.yaml").write_text(YAML_PROFILES)
+    profiles = load_user_profiles(str(tmp_path))
+    assert profiles["yabby"] == {"temp_range": (15.0, 24.5), "ideal_cloud": 40.0, "prefers_low_pressure": False}
+    assert profiles["bream"]["temp_range"] == (16.0, 22.0)
+
+
+def test_json_profiles_are_read_when_there_is_no_yaml(tmp_path):
+    profile = {"temp_range": [10, 18], "ideal_cloud": 60, "prefers_low_pressure": True}
+    (tmp_path / "fishing_assistant_profiles.json").write_text(json.dumps({"yabby": profile}))
+    assert load_user_profiles(str(tmp_path)) == {
+        "yabby": {"temp_range": (10.0, 18.0), "ideal_cloud": 60.0, "prefers_low_pressure": True}
+    }
+
+
+def test_no_profile_file(tmp_path):
+    assert load_user_profiles(str(tmp_path)) == {}
+
+
+@pytest.mark.parametrize(
+    "profiles",
+    [
+        {"yabby": {"temp_range": [15, 24]}},  # ideal_cloud missing
+        {"yabby": {"temp_range": [24, 15], "ideal_cloud": 40}},  # low above high
+        {"yabby": {"temp_range": [15, 24, 30], "ideal_cloud": 40}},
+        {"yabby": {"temp_range": [15, 24], "ideal_cloud": 150}},
+        {"yabby": {"temp_range": [15, 24], "ideal_cloud": 40, "depth": 3}},
+        {"Big Yabby": {"temp_range": [15, 24], "ideal_cloud": 40}},  # not a slug
+    ],
+)
+def test_invalid_profiles_are_rejected(tmp_path, caplog, profiles):
+    (tmp_path / "fishing_assistant_profiles.json").write_text(json.dumps(profiles))
+    with caplog.at_level(logging.ERROR):
+        assert load_user_profiles(str(tmp_path)) == {}
+    assert "Ignoring fish profiles" in caplog.text
+
+
+def test_malformed_yaml_is_rejected(tmp_path):
+    (tmp_path / "fishing_assistant_profiles.yaml").write_text("yabby: [unclosed\n")
+    assert load_user_profiles(str(tmp_path)) == {}
+
+
+def test_user_profiles_override_built_in_species(run_with_hass, tmp_path):
+    (tmp_path / "fishing_assistant_profiles.yaml").write_text(YAML_PROFILES)
+
+    async def test(hass):
+        table = await async_get_profile_table(hass)
+        assert await async_get_profile_table(hass) is table
+        return table
+
+    table = run_with_hass(test)
+    assert len(table) == len(FISH_PROFILES) + 1
+    bream = table.index["bream"]
+    assert (table.temp_low[bream], table.temp_high[bream]) == (16.0, 22.0)
+    assert not table.prefers_low_pressure[bream]
+    # Species the user did not mention keep their built-in profile
+    carp = table.index["carp"]
+    assert table.temp_low[carp] == BUILTIN_PROFILE_TABLE.temp_low[BUILTIN_PROFILE_TABLE.index["carp"]]
+    assert "yabby" in table
+
+
+def test_built_in_table_is_used_without_user_profiles(run_with_hass):
+    async def test(hass):
+        return await async_get_profile_table(hass)
+
+    assert run_with_hass(test) is BUILTIN_PROFILE_TABLE
@@ -0,0 +1,38 @@
+"""Request scheduler deadlines."""
+import asyncio
+
+from custom_components.fishing_assistant_au import ratelimit
+from custom_components.fishing_assistant_au.ratelimit import PRIORITY_REFRESH, PRIORITY_URGENT, RequestScheduler
+
+
+def test_urgent_call_does_not_wait_out_a_long_pause(run_with_hass):
+    async def test(hass):
+        scheduler = RequestScheduler(hass)
+        scheduler.pause(600)
+        return await asyncio.wait_for(scheduler.async_acquire(1, PRIORITY_URGENT), 1)
+
+    assert run_with_hass(test) is False
+
+
+def test_queued_call_gives_up_at_its_deadline(run_with_hass, monkeypatch):
+    monkeypatch.setitem(ratelimit.MAX_WAIT, PRIORITY_REFRESH, 0.05)
+
+    async def test(hass):
+        scheduler = RequestScheduler(hass, burst=1)
+        # Spend the only token, so the next call queues for ~1 s
+        assert await scheduler.async_acquire(1, PRIORITY_URGENT)
+        monkeypatch.setattr(scheduler, "_expected_wait", lambda cost, priority: 0.0)
+        acquired = await asyncio.wait_for(scheduler.async_acquire(1, PRIORITY_REFRESH), 1)
+        return acquired, scheduler.snapshot()["queue_depth"]
+
+    assert run_with_hass(test) == (False, 0)
+
+
+def test_call_within_its_bound_goes_out(run_with_hass):
+    async def test(hass):
+        scheduler = RequestScheduler(hass, rate=100.0, burst=1)
+        assert await scheduler.async_acquire(1, PRIORITY_REFRESH)
+        # Short of tokens for ~10 ms, well inside the bound
+        return await asyncio.wait_for(scheduler.async_acquire(1, PRIORITY_REFRESH), 1)
+
+    assert run_with_hass(test) is True
@@ -0,0 +1,83 @@
+"""The vectorized scorer against the scalar reference, and local astronomy."""
+import datetime
+
+import numpy as np
+import pytest
+
+from custom_components.fishing_assistant_au import score
+from custom_components.fishing_assistant_au.helpers.astro import (
+    EVENT_KEYS,
+    NO_EVENT,
+    LocalAstronomy,
+    localize_astronomy,
+)
+from custom_components.fishing_assistant_au.profile_table import (
+    BODY_TYPES,
+    BUILTIN_PROFILE_TABLE,
+    get_profile_weights,
+)
+
+START = datetime.date(2025, 1, 15)
+
+
+def _astronomy(days: int = 7, seed: int = 0) -> LocalAstronomy:
+    """Random events, including midnight (0), missing events and edge moon phases."""
+    rng = np.random.default_rng(seed)
+    events = {key: rng.integers(0, 24 * 60, days).astype(np.int16) for key in EVENT_KEYS}
+    events["sunrise"][0] = 0
+    events["moonrise"][1] = NO_EVENT
+    events["moon_transit"][2] = NO_EVENT
+    events["sunset"][3] = NO_EVENT
+    moon_phase = rng.uniform(0, 1, days)
+    moon_phase[:3] = (0.05, 0.95, np.nan)
+    return LocalAstronomy(START, events, moon_phase)
+
+
+@pytest.mark.parametrize("body_type", BODY_TYPES)
+def test_score_table_matches_scalar_reference(open_meteo_forecast, body_type):
+    hourly = score.build_hourly_arrays(open_meteo_forecast)
+    astro = _astronomy()
+    table = BUILTIN_PROFILE_TABLE
+    names = list(table.names)
+    weights = get_profile_weights(body_type)
+
+    rows = table.rows(names)
+    scores = score.score_table(hourly, astro, table, rows, table.weights(body_type))
+
+    days = [str(d) for d in hourly["datetime"].astype("datetime64[D]")]
+    for i, day in enumerate(days):
+        row = {key: hourly[key][i].item() for key in ("hour", "temp", "cloud", "pressure_trend", "wind", "precip")}
+        for s, (name, r) in enumerate(zip(names, rows)):
+            profile = {
+                "temp_range": (table.temp_low[r].item(), table.temp_high[r].item()),
+                "ideal_cloud": table.ideal_cloud[r].item(),
+            }
+            assert score._score_hour(row, profile, astro.day(day), weights) == scores[s, i], (name, day, i)
+
+
+def test_days_outside_the_astronomy_have_no_events():
+    astro = _astronomy()
+    events, moon_phase = astro.for_days(["2025-01-14", "2025-01-15", "2025-01-22"])
+    for key in EVENT_KEYS:
+        assert events[key][0] == NO_EVENT and events[key][2] == NO_EVENT
+        assert events[key][1] == astro.events[key][0]
+    assert np.isnan(moon_phase[0]) and np.isnan(moon_phase[2])
+
+
+def test_localize_moves_events_to_the_local_day():
+    # 19:00 UTC on the 14th is 06:00 on the 15th in Sydney (AEDT, UTC+11)
+    utc = {
+        "2025-01-14": {"sunrise": 19 * 60, "moon_phase": 0.4},
+        "2025-01-15": {"sunrise": 19 * 60 + 1, "sunset": 9 * 60, "moon_phase": 0.5},
+    }
+    astro = localize_astronomy(utc, "Australia/Sydney", START, 2)
+    assert astro.day("2025-01-15")["sunrise"] == 6 * 60
+    assert astro.day("2025-01-15")["sunset"] == 20 * 60
+    assert astro.day("2025-01-16")["sunrise"] == 6 * 60 + 1
+    assert astro.day("2025-01-16")["sunset"] is None
+    assert astro.day("2025-01-15")["moon_phase"] == 0.5
+
+
+def test_localize_unknown_timezone_falls_back_to_utc():
+    astro = localize_astronomy({"2025-01-15": {"sunrise": 300}}, "Not/AZone", START, 1)
+    assert astro.day("2025-01-15")["sunrise"] == 300
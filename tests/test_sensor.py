@@ -0,0 +1,68 @@
+"""Which coordinator refreshes make a FishScoreSensor write its state."""
+import datetime
+
+import pytest
+
+from custom_components.fishing_assistant_au.sensor import FishScoreSensor
+
+TODAY = str(datetime.date.today())
+
+
+class _Coordinator:
+    def __init__(self):
+        self.data = None
+        self.last_update_success = True
+
+    def async_update_listeners(self):
+        pass
+
+
+def _data(score: int = 5, stale: bool = False, fetched_hour: int = 0) -> dict:
+    return {
+        "forecasts": {"bream": {TODAY: {"score": score}}},
+        "top_windows": {"bream": []},
+        "stale": stale,
+        "fetched_at": datetime.datetime(2025, 1, 15, fetched_hour, tzinfo=datetime.timezone.utc),
+    }
+
+
+@pytest.fixture
+def sensor():
+    coordinator = _Coordinator()
+    coordinator.data = _data()
+    sensor = FishScoreSensor(coordinator, "Home", "bream", -33.8, 151.2, "lake", "Australia/Sydney", 20, "entry")
+    sensor.writes = 0
+
+    def write():
+        sensor.writes += 1
+
+    sensor.async_write_ha_state = write
+    # As async_added_to_hass leaves it, with the first state written
+    sensor._update_from_coordinator()
+    sensor._written = sensor._write_key()
+    return sensor
+
+
+def _refresh(sensor, data: dict) -> int:
+    sensor.coordinator.data = data
+    sensor._handle_coordinator_update()
+    return sensor.writes
+
+
+def test_unchanged_refresh_does_not_write(sensor):
+    assert _refresh(sensor, _data()) == 0
+
+
+def test_new_fetch_time_alone_does_not_write(sensor):
+    assert _refresh(sensor, _data(fetched_hour=6)) == 0
+    assert sensor.extra_state_attributes["fetched_at"].hour == 6
+
+
+@pytest.mark.parametrize("data", [_data(score=6), _data(stale=True)], ids=["score", "stale"])
+def test_visible_change_writes(sensor, data):
+    assert _refresh(sensor, data) == 1
+
+
+def test_fetch_time_is_not_recorded():
+    assert "fetched_at" in FishScoreSensor._unrecorded_attributes
+    assert "stale" not in FishScoreSensor._unrecorded_attributes
@@ -0,0 +1,44 @@
+"""Loading process-wide objects into hass.data once."""
+import asyncio
+
+import pytest
+
+from custom_components.fishing_assistant_au.helpers.shared import async_get_shared
+
+KEY = "fishing_assistant_au_test"
+
+
+def test_concurrent_callers_share_one_load(run_with_hass):
+    loads = []
+
+    async def load(hass):
+        loads.append(1)
+        await asyncio.sleep(0)
+        return object()
+
+    async def test(hass):
+        results = await asyncio.gather(*(async_get_shared(hass, KEY, load) for _ in range(3)))
+        return results, hass.data[KEY]
+
+    results, stored = run_with_hass(test)
+    assert loads == [1]
+    assert all(result is stored for result in results)
+
+
+def test_failed_load_is_retried(run_with_hass):
+    attempts = []
+
+    async def load(hass):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise OSError("storage unavailable")
+        return "loaded"
+
+    async def test(hass):
+        with pytest.raises(OSError):
+            await async_get_shared(hass, KEY, load)
+        assert KEY not in hass.data
+        return await async_get_shared(hass, KEY, load)
+
+    assert run_with_hass(test) == "loaded"
+    assert len(attempts) == 2
@@ -0,0 +1,81 @@
+"""Weather cache bounds and the stale paths of get_location_forecast_data."""
+import datetime
+
+from custom_components.fishing_assistant_au import score
+from custom_components.fishing_assistant_au.helpers import weather_cache
+from custom_components.fishing_assistant_au.helpers.grid import weather_cell
+from custom_components.fishing_assistant_au.helpers.weather_cache import WeatherCache
+
+TODAY = datetime.date.today()
+TIMEZONE = "Australia/Sydney"
+
+
+def _forecast(start: datetime.date) -> dict:
+    times = [f"{start}T{hour:02d}:00" for hour in range(24)]
+    return {"hourly": {"time": times, "temperature_2m": [20.0] * 24}, "daily": {}}
+
+
+def test_least_recently_used_entries_are_evicted(run_with_hass, monkeypatch):
+    monkeypatch.setattr(weather_cache, "WEATHER_CACHE_MAX_ENTRIES", 3)
+
+    async def test(hass):
+        cache = WeatherCache(hass)
+        for lat in (1, 2, 3):
+            cache.set(lat, 0, TIMEZONE, 0, TODAY, TODAY, _forecast(TODAY))
+            # Distinct timestamps, oldest first
+            cache._entries[cache._key(lat, 0, TIMEZONE, 0)]["last_used"] = f"2000-01-0{lat}"
+        assert cache.get(1, 0, TIMEZONE, 0, TODAY, TODAY)
+        cache.set(4, 0, TIMEZONE, 0, TODAY, TODAY, _forecast(TODAY))
+        return [lat for lat in (1, 2, 3, 4) if cache.latest(lat, 0, TIMEZONE, 0)]
+
+    assert run_with_hass(test) == [1, 3, 4]
+
+
+class _AstronomyCache:
+    async def async_get_forecast(self, lat, lon, days, cell_deg, start_date):
+        return {str(start_date): {}}
+
+
+async def _astronomy_cache(hass):
+    return _AstronomyCache()
+
+
+async def _upstream_must_not_be_called(*args, **kwargs):
+    raise AssertionError("went upstream")
+
+
+def test_first_load_renders_an_older_horizon_without_going_upstream(run_with_hass, monkeypatch):
+    monkeypatch.setattr(score, "async_get_astronomy_cache", _astronomy_cache)
+    monkeypatch.setattr(score, "get_forecast_data", _upstream_must_not_be_called)
+    yesterday = TODAY - datetime.timedelta(days=1)
+
+    async def test(hass):
+        cache = await weather_cache.async_get_weather_cache(hass)
+        cell = weather_cell(-33.87, 151.21, 20, 0.05)
+        # Stored before midnight: still within its model run, but for yesterday's horizon
+        cache.set(cell.lat, cell.lon, TIMEZONE, cell.elevation, yesterday, yesterday, _forecast(yesterday))
+        return await score.get_location_forecast_data(hass, -33.87, 151.21, TIMEZONE, 20, allow_stale=True)
+
+    data = run_with_hass(test)
+    assert data["stale"] is True
+    assert data["weather"]["hourly"]["time"][0].startswith(str(yesterday))
+
+
+def test_upstream_failure_serves_the_last_forecast_as_stale(run_with_hass, monkeypatch):
+    monkeypatch.setattr(score, "async_get_astronomy_cache", _astronomy_cache)
+
+    async def upstream_fails(*args, **kwargs):
+        return {}
+
+    monkeypatch.setattr(score, "get_forecast_data", upstream_fails)
+    yesterday = TODAY - datetime.timedelta(days=1)
+
+    async def test(hass):
+        cache = await weather_cache.async_get_weather_cache(hass)
+        cell = weather_cell(-33.87, 151.21, 20, 0.05)
+        cache.set(cell.lat, cell.lon, TIMEZONE, cell.elevation, yesterday, yesterday, _forecast(yesterday))
+        return await score.get_location_forecast_data(hass, -33.87, 151.21, TIMEZONE, 20)
+
+    data = run_with_hass(test)
+    assert data["stale"] is True
+    assert data["weather"]["hourly"]["time"][0].startswith(str(yesterday))
@@ -0,0 +1,50 @@
+"""top_k_windows against a brute-force greedy search."""
+import numpy as np
+import pytest
+
+from custom_components.fishing_assistant_au.windows import top_k_windows, window_sums
+
+
+def _brute_force(sums, length, k, groups, n_groups):
+    picks = np.full((sums.shape[0], n_groups, k), -1, dtype=np.intp)
+    for s, row in enumerate(sums):
+        for g in range(n_groups):
+            taken = []
+            for i in range(k):
+                best = None
+                for start in np.flatnonzero(groups == g):
+                    if row[start] <= 0 or any(abs(start - t) < length for t in taken):
+                        continue
+                    # Strict > keeps the earliest start on ties
+                    if best is None or row[start] > row[best]:
+                        best = start
+                if best is None:
+                    break
+                taken.append(best)
+                picks[s, g, i] = best
+    return picks
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_top_k_windows_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    n_groups = int(rng.integers(1, 5))
+    per_group = int(rng.integers(1, 30))
+    length = int(rng.integers(1, 8))
+    k = int(rng.integers(0, 5))
+    # Small integer scores, including negatives, so ties and skipped windows occur
+    series = rng.integers(-3, 4, size=(3, n_groups * per_group + length - 1))
+    sums = window_sums(series, length)
+    groups = np.repeat(np.arange(n_groups), per_group)
+
+    expected = _brute_force(sums, length, k, groups, n_groups)
+    np.testing.assert_array_equal(top_k_windows(sums, length, k, groups, n_groups), expected)
+
+
+def test_top_k_windows_without_groups_searches_whole_horizon():
+    sums = np.array([[1, 5, 5, 0, 2, -1, 4]])
+    picks = top_k_windows(sums, length=2, k=4)
+    np.testing.assert_array_equal(picks, [[[1, 6, 4, -1]]])
+    np.testing.assert_array_equal(
+        picks, _brute_force(sums, 2, 4, np.zeros(sums.shape[1], dtype=np.intp), 1)
+    )